@@ -1,8 +1,11 @@
 # streamlit run xxxx
 # import sys
+import atexit
+import bisect
 import os
 import re
 import sqlite3
+import threading
 import pandas as pd
 from collections import Counter
 import streamlit as st
@@ -10,95 +13,161 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from get_default_word_bank import get_default_word_bank
 
+# Red bold for HTML; display with st.markdown(highlighted_text, unsafe_allow_html=True)
+_SPAN_OPEN = "<span style='color:red;font-weight:bold;'>"
+_SPAN_CLOSE = "</span>"
+
+# Words and phrases share ai_terms with ai-word-sql-manager.py; re-adding a term updates it
+_INSERT_TERM_SQL = '''
+INSERT INTO ai_terms (kind, term, frequency, category, source) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(kind, term) DO UPDATE SET
+    frequency = excluded.frequency, category = excluded.category, source = excluded.source
+'''
+
+
+def _match_key(matched):
+    """Lowercase matched text to its lookup key without changing its length"""
+    lowered = matched.lower()
+    if len(lowered) == len(matched):
+        return lowered
+    # A few characters (e.g. 'İ') lowercase to several code points; keep only the first
+    return "".join(c.lower()[0] for c in matched)
+
+
+_WORD_BOUNDARY = re.compile(r'\b')
+
+
+def _fuse_patterns(rows):
+    """Build one case-insensitive lookahead alternation over (term, frequency, category, source) rows"""
+    # Keyed by lowercase term; every row is kept (in frequency order) so duplicates still count
+    markers = {}
+    for term, frequency, category, source in rows:
+        markers.setdefault(term.lower(), []).append((term, frequency, category, source))
+    if not markers:
+        return None, markers, {}
+    # Longest first; the lookahead consumes nothing, so the scan still tries every start position
+    keys = sorted(markers, key=len, reverse=True)
+    alternation = "|".join(re.escape(term) for term in keys)
+    # Shorter terms the longest match at a position can hide (e.g. 'delve' inside 'delve into'),
+    # found by probing each of the key's own prefixes, longest first
+    prefixes = {key: [key[:i] for i in range(len(key) - 1, 0, -1) if key[:i] in markers] for key in keys}
+    return re.compile(r'\b(?=(' + alternation + r')\b)', re.IGNORECASE), markers, prefixes
+
+
+def _find_terms(fused, text):
+    """Yield (start, end, row) for every term match, as separate per-term finditer() scans would"""
+    pattern, markers, prefixes = fused
+    if pattern is None:
+        return
+    # Each term's matches don't overlap each other, but may overlap other terms' matches
+    last_end = {}
+    for match in pattern.finditer(text):
+        start = match.start()
+        key = _match_key(match.group(1))
+        if key not in markers:
+            continue
+        for term in [key] + prefixes[key]:
+            end = start + len(term)
+            if last_end.get(term, 0) > start or (term != key and not _WORD_BOUNDARY.match(text, end)):
+                continue
+            last_end[term] = end
+            for row in markers[term]:
+                yield start, end, row
+
+
 class AIWordHighlighter:
+    __slots__ = ("db_path", "conn", "_lock", "_compiled")
+
     def __init__(self, db_path="ai_words.db"):
         """Initialize with database path (default is file in current directory)"""
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
+        # The instance is cached across Streamlit reruns, which run on different threads
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL + NORMAL sync avoids an fsync and a rollback-journal rewrite per commit
+        self.conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-20000;")
+        # Sessions share the connection, so writes take the lock and every call gets its own cursor
+        self._lock = threading.Lock()
+        # Compiled (phrases, words) patterns, rebuilt lazily after the data changes
+        self._compiled = None
         self.initialize_database()
         
         # Only load default words if the database is empty
-        self.cursor.execute('SELECT COUNT(*) FROM ai_words')
-        word_count = self.cursor.fetchone()[0]
-        self.cursor.execute('SELECT COUNT(*) FROM ai_phrases')
-        phrase_count = self.cursor.fetchone()[0]
+        term_count = self.conn.execute('SELECT COUNT(*) FROM ai_terms').fetchone()[0]
         
-        if word_count == 0 and phrase_count == 0:
+        if term_count == 0:
             self.load_default_words()
 
     def initialize_database(self):
         """Create the necessary tables if they don't exist"""
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_words (
-            id INTEGER PRIMARY KEY,
-            word TEXT NOT NULL,
-            frequency INTEGER DEFAULT 1,
-            category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
-        )
-        ''')
+        created = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ai_terms'").fetchone() is None
         
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_phrases (
+        # One table for words and phrases, told apart by kind
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS ai_terms (
             id INTEGER PRIMARY KEY,
-            phrase TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK(kind IN ('word', 'phrase')),
+            term TEXT NOT NULL,
             frequency INTEGER DEFAULT 1,
             category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
+            source TEXT DEFAULT 'default',
+            UNIQUE(kind, term)
         )
         ''')
         
-        # Create indices for faster lookups
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_word ON ai_words(word)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_phrase ON ai_phrases(phrase)')
+        # Databases from before ai_terms kept each kind in a table of its own
+        if created:
+            for kind, table, column in (('word', 'ai_words', 'word'), ('phrase', 'ai_phrases', 'phrase')):
+                if self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone():
+                    self.conn.execute(f'''
+                    INSERT OR IGNORE INTO ai_terms (kind, term, frequency, category, source)
+                    SELECT ?, lower({column}), frequency, category, source FROM {table} ORDER BY id
+                    ''', (kind,))
         self.conn.commit()
 
     def load_default_words(self):
         default_words, default_phrases = get_default_word_bank()
-        # Clear existing data
-        self.cursor.execute('DELETE FROM ai_words')
-        self.cursor.execute('DELETE FROM ai_phrases')
-        
-        # Insert words
-        self.cursor.executemany(
-            'INSERT INTO ai_words (word, frequency, category, source) VALUES (?, ?, ?, ?)',
-            default_words
-        )
-        
-        # Insert phrases
-        self.cursor.executemany(
-            'INSERT INTO ai_phrases (phrase, frequency, category, source) VALUES (?, ?, ?, ?)',
-            default_phrases
-        )
-        
-        self.conn.commit()
+        # Seed everything in a single transaction
+        with self._lock, self.conn:
+            # Clear existing data
+            self.conn.execute('DELETE FROM ai_terms')
+            
+            # Insert words
+            self.conn.executemany(_INSERT_TERM_SQL, (("word",) + row for row in default_words))
+            
+            # Insert phrases
+            self.conn.executemany(_INSERT_TERM_SQL, (("phrase",) + row for row in default_phrases))
+            self._compiled = None
 
     def add_word(self, word, frequency=1, category="general", source="user"):
         """Add a new AI word to the database"""
-        self.cursor.execute(
-            'INSERT INTO ai_words (word, frequency, category, source) VALUES (?, ?, ?, ?)',
-            (word.lower(), frequency, category, source)
-        )
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(_INSERT_TERM_SQL, ("word", word.lower(), frequency, category, source))
+            self.conn.commit()
+            self._compiled = None
 
     def add_phrase(self, phrase, frequency=1, category="general", source="user"):
         """Add a new AI phrase to the database"""
-        self.cursor.execute(
-            'INSERT INTO ai_phrases (phrase, frequency, category, source) VALUES (?, ?, ?, ?)',
-            (phrase.lower(), frequency, category, source)
-        )
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(_INSERT_TERM_SQL, ("phrase", phrase.lower(), frequency, category, source))
+            self.conn.commit()
+            self._compiled = None
 
     def get_all_words(self):
-        """Get all AI words from the database"""
-        self.cursor.execute('SELECT word, frequency, category, source FROM ai_words ORDER BY frequency DESC')
-        return self.cursor.fetchall()
+        """Get all AI words from the database as a lazy row iterator"""
+        # Use a fresh cursor so words and phrases can be iterated side by side
+        return self.conn.execute("SELECT term, frequency, category, source FROM ai_terms WHERE kind = 'word' ORDER BY frequency DESC, id")
 
     def get_all_phrases(self):
-        """Get all AI phrases from the database"""
-        self.cursor.execute('SELECT phrase, frequency, category, source FROM ai_phrases ORDER BY frequency DESC')
-        return self.cursor.fetchall()
+        """Get all AI phrases from the database as a lazy row iterator"""
+        return self.conn.execute("SELECT term, frequency, category, source FROM ai_terms WHERE kind = 'phrase' ORDER BY frequency DESC, id")
+
+    def get_all_words_df(self):
+        """Get all AI words from the database as a DataFrame"""
+        return pd.read_sql_query("SELECT term AS word, frequency, category, source FROM ai_terms WHERE kind = 'word' ORDER BY frequency DESC, id", self.conn)
+
+    def get_all_phrases_df(self):
+        """Get all AI phrases from the database as a DataFrame"""
+        return pd.read_sql_query("SELECT term AS phrase, frequency, category, source FROM ai_terms WHERE kind = 'phrase' ORDER BY frequency DESC, id", self.conn)
 
     def import_words_from_csv(self, file_path):
         """Import words from a CSV file"""
@@ -108,8 +177,13 @@ class AIWordHighlighter:
             
             # Check if all required columns exist
             if all(col in df.columns for col in required_columns):
-                for index, row in df.iterrows():
-                    self.add_word(row['word'], row['frequency'], row['category'], row['source'])
+                rows = df[required_columns].itertuples(index=False, name=None)
+                with self._lock, self.conn:
+                    self.conn.executemany(
+                        _INSERT_TERM_SQL,
+                        (("word", word.lower(), frequency, category, source) for word, frequency, category, source in rows)
+                    )
+                    self._compiled = None
                 return True, f"Successfully imported {len(df)} words"
             else:
                 return False, "CSV must have columns: word, frequency, category, source"
@@ -124,65 +198,70 @@ class AIWordHighlighter:
             
             # Check if all required columns exist
             if all(col in df.columns for col in required_columns):
-                for index, row in df.iterrows():
-                    self.add_phrase(row['phrase'], row['frequency'], row['category'], row['source'])
+                rows = df[required_columns].itertuples(index=False, name=None)
+                with self._lock, self.conn:
+                    self.conn.executemany(
+                        _INSERT_TERM_SQL,
+                        (("phrase", phrase.lower(), frequency, category, source) for phrase, frequency, category, source in rows)
+                    )
+                    self._compiled = None
                 return True, f"Successfully imported {len(df)} phrases"
             else:
                 return False, "CSV must have columns: phrase, frequency, category, source"
         except Exception as e:
             return False, f"Error importing CSV: {str(e)}"
 
+    def get_compiled_patterns(self):
+        """Compile the phrases and the words into one lookahead alternation each, reused until the data changes"""
+        compiled = self._compiled
+        if compiled is None:
+            # Under the lock, so a write landing mid-compile can't be cached over
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = (_fuse_patterns(self.get_all_phrases()), _fuse_patterns(self.get_all_words()))
+                compiled = self._compiled
+        return compiled
+
     def highlight_text(self, text):
         """Highlight AI words and phrases in the given text"""
-        # Get all words and phrases
-        words = self.get_all_words()
-        phrases = self.get_all_phrases()
-        # print(f"Words from database: {len(words)}, sample: {words[:5] if words else 'none'}")
-        # print(f"Phrases from database: {len(phrases)}, sample: {phrases[:5] if phrases else 'none'}")
-
-        # Create a copy of the text for highlighting
-        highlighted_text = text
+        # Get the fused phrase and word patterns
+        phrase_fused, word_fused = self.get_compiled_patterns()
+
         found_items = []
         
         # First detect phrases (to avoid highlighting parts of phrases as individual words)
-        for phrase, frequency, category, source in phrases:
-            pattern = r'\b' + re.escape(phrase) + r'\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
-            for match in matches:
-                found_items.append(("phrase", phrase, match.start(), match.end(), frequency, category, source))
-        
-        # After the phrase detection loop:
-        # print(f"Detected {len(found_items)} phrases")
+        phrase_starts = []
+        phrase_max_ends = []
+        for start, end, (phrase, frequency, category, source) in _find_terms(phrase_fused, text):
+            found_items.append(("phrase", phrase, start, end, frequency, category, source))
+            phrase_starts.append(start)
+            phrase_max_ends.append(max(end, phrase_max_ends[-1]) if phrase_max_ends else end)
 
-        # Then detect individual words
-        for word, frequency, category, source in words:
-            pattern = r'\b' + re.escape(word) + r'\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
-            for match in matches:
-                # Check if this word is part of a detected phrase
-                is_part_of_phrase = False
-                for item_type, item_text, start, end, _, _, _ in found_items:
-                    if item_type == "phrase" and start <= match.start() and match.end() <= end:
-                        is_part_of_phrase = True
-                        break
-                
-                if not is_part_of_phrase:
-                    found_items.append(("word", word, match.start(), match.end(), frequency, category, source))
-        
-        # Sort found items by position (start index) in reverse order
-        # This way we can replace from end to beginning without affecting positions
-        found_items.sort(key=lambda x: x[2], reverse=True)
-        
-        # Replace matches with highlighted versions
+        # Then detect individual words; phrase matches come in start order, so a word lies
+        # inside one iff the furthest end among phrases starting at or before it reaches it
+        for start, end, (word, frequency, category, source) in _find_terms(word_fused, text):
+            i = bisect.bisect_right(phrase_starts, start) - 1
+            if i >= 0 and end <= phrase_max_ends[i]:
+                continue
+            found_items.append(("word", word, start, end, frequency, category, source))
+        
+        # Sort found items by position (longest first on ties) and build the output in one pass
+        found_items.sort(key=lambda x: (x[2], -x[3]))
+        
+        # Every match counts towards the statistics; only the highlighting drops overlaps
+        out = []
+        cursor = 0
         for item_type, item_text, start, end, frequency, category, source in found_items:
-            original_text = text[start:end]
-            # highlighted = f"**{original_text}**"  # Bold for Markdown
-            highlighted = f"<span style='color:red;font-weight:bold;'>{original_text}</span>"  # Red bold for HTML
-            # And then make sure to use st.markdown(highlighted_text, unsafe_allow_html=True) when displaying the text in Streamlit.
-            # highlighted = f"<span style='color:red'>{original_text}</span>"  # Red bold for Streamlit Markdown
-            highlighted_text = highlighted_text[:start] + highlighted + highlighted_text[end:]
+            # Skip matches overlapping one that is already highlighted
+            if start < cursor:
+                continue
+            out.append(text[cursor:start])
+            out.append(_SPAN_OPEN)
+            out.append(text[start:end])
+            out.append(_SPAN_CLOSE)
+            cursor = end
+        out.append(text[cursor:])
+        highlighted_text = "".join(out)
         
         return highlighted_text, found_items
 
@@ -256,15 +335,11 @@ class AIWordHighlighter:
     
     def export_words_to_csv(self, file_path):
         """Export words to a CSV file"""
-        words = self.get_all_words()
-        df = pd.DataFrame(words, columns=['word', 'frequency', 'category', 'source'])
-        df.to_csv(file_path, index=False)
+        self.get_all_words_df().to_csv(file_path, index=False)
         
     def export_phrases_to_csv(self, file_path):
         """Export phrases to a CSV file"""
-        phrases = self.get_all_phrases()
-        df = pd.DataFrame(phrases, columns=['phrase', 'frequency', 'category', 'source'])
-        df.to_csv(file_path, index=False)
+        self.get_all_phrases_df().to_csv(file_path, index=False)
     
     def close(self):
         """Close the database connection"""
@@ -282,14 +357,21 @@ def load_readme(file_path="README.md"):
     except Exception as e:
         return f"Error loading README.md: {str(e)}"
 
+@st.cache_resource
+def get_highlighter():
+    """Create the highlighter once and share it across Streamlit reruns"""
+    highlighter = AIWordHighlighter()
+    atexit.register(highlighter.close)
+    return highlighter
+
 def create_streamlit_app():
     """Create a Streamlit app for the AI Word Highlighter"""
     st.title("AI Word and Phrase Highlighter")
     st.markdown("Provided free by Koutian Wu.")
     st.markdown("This tool helps identify common words and phrases used in AI-generated content.")
     
-    # Initialize the highlighter
-    highlighter = AIWordHighlighter()
+    # Reuse the cached highlighter (DB connection and compiled patterns)
+    highlighter = get_highlighter()
     
     # Create tabs
     tab1, tab2, tab3 = st.tabs(["Highlight Text", "Manage Words & Phrases", "About"])
@@ -378,17 +460,17 @@ def create_streamlit_app():
         
         # Display words and phrases
         st.subheader("AI Words in Database")
-        words = highlighter.get_all_words()
-        if words:
-            word_df = pd.DataFrame(words, columns=["Word", "Frequency", "Category", "Source"])
+        word_df = highlighter.get_all_words_df()
+        if not word_df.empty:
+            word_df.columns = ["Word", "Frequency", "Category", "Source"]
             st.dataframe(word_df)
         else:
             st.info("No AI words in the database.")
         
         st.subheader("AI Phrases in Database")
-        phrases = highlighter.get_all_phrases()
-        if phrases:
-            phrase_df = pd.DataFrame(phrases, columns=["Phrase", "Frequency", "Category", "Source"])
+        phrase_df = highlighter.get_all_phrases_df()
+        if not phrase_df.empty:
+            phrase_df.columns = ["Phrase", "Frequency", "Category", "Source"]
             st.dataframe(phrase_df)
         else:
             st.info("No AI phrases in the database.")
@@ -506,9 +588,6 @@ def create_streamlit_app():
     print("\nRunning the script directly with Python won't work correctly.")
     print("="*70 + "\n")
 
-    # Close the database connection when done
-    highlighter.close()
-
 # Run the Streamlit app if this script is run directly
 if __name__ == "__main__":
     create_streamlit_app()
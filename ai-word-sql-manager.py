@@ -1,12 +1,64 @@
 import sqlite3
+import csv
 import os
-import pandas as pd
+import threading
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
+
+try:
+    import ahocorasick
+except ImportError:  # pip install pyahocorasick
+    ahocorasick = None
+
+# Upsert for words or phrases; keeps the existing id when a term is re-added
+_INSERT_TERMS_SQL = '''
+INSERT INTO ai_terms (kind, term, frequency, category, source)
+VALUES {values}
+ON CONFLICT(kind, term) DO UPDATE SET
+    frequency = excluded.frequency,
+    category = excluded.category,
+    source = excluded.source
+'''
+_TERM_VALUES = '(?, ?, ?, ?, ?)'
+_INSERT_TERM_SQL = _INSERT_TERMS_SQL.format(values=_TERM_VALUES)
+# Largest batch sent as one multi-row VALUES statement; keeps its parameters under
+# the 999-variable limit of older SQLite builds
+_MAX_VALUES_ROWS = 999 // 5
+# Rows pulled from SQLite per fetchmany() call while streaming terms
+_FETCH_ROWS = 1024
+_DELETE_TERM_SQL = 'DELETE FROM ai_terms WHERE kind = ? AND term = ?'
+
+# Table and text column that databases created before ai_terms kept each kind in
+_LEGACY_TABLES = {'word': ('ai_words', 'word'), 'phrase': ('ai_phrases', 'phrase')}
+
+# The trigram tokenizer indexes every 3-character run, so MATCH answers substring
+# searches; shorter search terms have no trigram and go through LIKE instead
+_FTS_MIN_TERM = 3
+
+def _like_escape(text):
+    """Escape LIKE's wildcards in text, for patterns used with ESCAPE '\\'"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 class AIWordDatabaseManager:
     """
     A class to manage AI words and phrases in a SQLite database.
     This can be used to create, update, and query a database of words/phrases
     commonly found in AI-generated content.
+
+    Words and phrases share the ai_terms table, told apart by its kind column
+    ('word' or 'phrase'); the *_word/*_phrase methods are shorthands for the
+    *_term methods with that kind. The analyzer and the KW highlighter read and
+    write the same table.
+
+    Single-row changes (add_word, add_phrase, delete_word, delete_phrase) are
+    not committed on their own: wrap a batch of them in `with manager.conn:`
+    or call flush(); close() also flushes.
+
+    Threads share the manager's connection, so they share its transaction:
+    every write takes a lock, and the batch methods run in a savepoint so a
+    failed batch only undoes its own rows. A batch that succeeds commits the
+    whole transaction, including single-row changes any thread left pending.
     """
     
     def __init__(self, db_path="ai_words.db"):
@@ -17,40 +69,214 @@ class AIWordDatabaseManager:
             db_path (str): Path to the SQLite database file
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
+        # One connection shared by every thread, so their statements run one at a time and
+        # see each other's uncommitted changes; room for every statement the manager
+        # issues, so none is re-prepared
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        # WAL + NORMAL sync drops the fsync and rollback-journal rewrite from every commit
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # Rows unpack and index like tuples and can also be read by column name, e.g. row['frequency']
+        self.conn.row_factory = sqlite3.Row
+        # Each thread gets its own cursor, so one thread's query can't reset another's results
+        self._tls = threading.local()
+        # Held by every write, so one thread's batch never interleaves with another's changes;
+        # re-entrant, since a batch may pull its rows from a query on the manager
+        self._write_lock = threading.RLock()
+        # Results of the list queries keyed by method and arguments, valid while _revision()
+        # still equals _cache_revision
+        self._cache = {}
+        self._cache_revision = None
+        # Read-only RAM copy of the file once load_in_memory() is called, else None, and the
+        # _revision() it was copied at
+        self._memory = None
+        self._memory_revision = None
         self.setup_database()
     
+    @property
+    def cursor(self):
+        """This thread's cursor on the shared connection, created on first use"""
+        cursor = getattr(self._tls, 'cursor', None)
+        if cursor is None:
+            cursor = self._tls.cursor = self.conn.cursor()
+        return cursor
+
+    @contextmanager
+    def _batch(self):
+        """
+        Run a batch of writes under the write lock and commit it.
+        
+        The batch is a savepoint inside the connection's transaction, so if it fails
+        only its own rows are rolled back and changes left pending by add_word and the
+        like (from any thread) stay pending. If it succeeds, the commit covers those
+        pending changes as well.
+        """
+        with self._write_lock:
+            self.conn.execute('SAVEPOINT batch')
+            try:
+                yield
+            except BaseException:
+                self.conn.execute('ROLLBACK TO batch')
+                self.conn.execute('RELEASE batch')
+                raise
+            self.conn.execute('RELEASE batch')
+            self.conn.commit()
+
+    def _write(self, sql, params=(), many=False):
+        """Run one write statement (executemany() if many) and return its row count; callers hold the write lock"""
+        cursor = self.cursor
+        (cursor.executemany if many else cursor.execute)(sql, params)
+        return cursor.rowcount
+
+    def _revision(self):
+        """A value that changes whenever this or any other connection writes to the database"""
+        # data_version only moves for other connections' commits, total_changes for our own writes
+        return self.conn.total_changes, self.conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def _cached(self, key, build):
+        """
+        Return the cached result for key, calling build() to compute it if needed.
+        
+        The whole cache is dropped first if anything, this manager or another
+        connection, wrote to the database since it was filled.
+        """
+        with self._write_lock:
+            revision = self._revision()
+            if revision != self._cache_revision:
+                self._cache.clear()
+                self._cache_revision = revision
+            if key not in self._cache:
+                self._cache[key] = build()
+            return self._cache[key]
+
+    def _reader(self):
+        """
+        The connection queries run on.
+        
+        After load_in_memory() that is the RAM copy, re-copied from the file first if
+        anything was written since; while this connection has uncommitted changes,
+        which the copy can't hold, queries go to the file connection instead.
+        """
+        if self._memory is None:
+            return self.conn
+        with self._write_lock:
+            if self.conn.in_transaction:
+                return self.conn
+            if self._revision() != self._memory_revision:
+                self._copy_to_memory()
+            return self._memory
+
+    def _copy_to_memory(self):
+        """Replace the RAM copy with a fresh one of the file; callers hold the write lock"""
+        # A new connection rather than a backup over the old one, so queries still
+        # iterating the old copy in other threads are left alone
+        memory = sqlite3.connect(':memory:', check_same_thread=False, cached_statements=256)
+        self.conn.backup(memory)
+        memory.row_factory = sqlite3.Row
+        memory.execute('PRAGMA query_only = ON')
+        self._memory, self._memory_revision = memory, self._revision()
+
     def setup_database(self):
         """Create the necessary tables if they don't exist"""
-        # Create table for AI words
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_words (
-            id INTEGER PRIMARY KEY,
-            word TEXT UNIQUE NOT NULL,
-            frequency INTEGER DEFAULT 1,
-            category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
-        )
-        ''')
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ai_terms'")
+        created = self.cursor.fetchone() is None
         
-        # Create table for AI phrases
+        # One table for AI words and phrases
         self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_phrases (
+        CREATE TABLE IF NOT EXISTS ai_terms (
             id INTEGER PRIMARY KEY,
-            phrase TEXT UNIQUE NOT NULL,
+            kind TEXT NOT NULL CHECK(kind IN ('word', 'phrase')),
+            term TEXT NOT NULL,
             frequency INTEGER DEFAULT 1,
             category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
+            source TEXT DEFAULT 'default',
+            UNIQUE(kind, term)
         )
         ''')
+        if created:
+            self._copy_legacy_tables()
         
-        # Create indices for faster lookups
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_word ON ai_words(word)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_phrase ON ai_phrases(phrase)')
+        # LIKE is case-insensitive, so only a NOCASE index lets it run a prefix as a range scan
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_terms_kind_term ON ai_terms(kind, term COLLATE NOCASE)')
+        # Covering indices for the category and source lists
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_terms_kind_category ON ai_terms(kind, category)')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_terms_source ON ai_terms(source)')
+        
+        # Full-text index for substring search (False when SQLite lacks FTS5)
+        self._fts = self._setup_fts()
         
         self.conn.commit()
 
+    def _copy_legacy_tables(self):
+        """Copy rows from the old ai_words/ai_phrases tables into a newly created ai_terms"""
+        for kind, (table, column) in _LEGACY_TABLES.items():
+            self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+            if self.cursor.fetchone() is None:
+                continue
+            # The old tables are left in place, unused; terms are lowercased like every
+            # other write, and duplicates keep their first row
+            self.cursor.execute(f'''
+            INSERT OR IGNORE INTO ai_terms (kind, term, frequency, category, source)
+            SELECT ?, lower({column}), frequency, category, source FROM {table} ORDER BY id
+            ''', (kind,))
+
+    def _setup_fts(self):
+        """
+        Create the trigram FTS5 index over ai_terms and the triggers that keep it in sync.
+        
+        Returns:
+            bool: True if the index is available, False if SQLite was built without FTS5
+        """
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'ai_terms_fts'")
+        if self.cursor.fetchone() is None:
+            try:
+                self.cursor.execute(
+                    "CREATE VIRTUAL TABLE ai_terms_fts USING fts5(term, content='ai_terms', content_rowid='id', tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                return False
+            # Index the rows that were already in the table
+            self.cursor.execute("INSERT INTO ai_terms_fts(ai_terms_fts) VALUES ('rebuild')")
+        
+        self.cursor.executescript("""
+        CREATE TRIGGER IF NOT EXISTS ai_terms_ai AFTER INSERT ON ai_terms BEGIN
+            INSERT INTO ai_terms_fts(rowid, term) VALUES (new.id, new.term);
+        END;
+        CREATE TRIGGER IF NOT EXISTS ai_terms_ad AFTER DELETE ON ai_terms BEGIN
+            INSERT INTO ai_terms_fts(ai_terms_fts, rowid, term) VALUES ('delete', old.id, old.term);
+        END;
+        CREATE TRIGGER IF NOT EXISTS ai_terms_au AFTER UPDATE OF term ON ai_terms BEGIN
+            INSERT INTO ai_terms_fts(ai_terms_fts, rowid, term) VALUES ('delete', old.id, old.term);
+            INSERT INTO ai_terms_fts(rowid, term) VALUES (new.id, new.term);
+        END;
+        """)
+        return True
+
+    def add_term(self, kind, term, frequency=1, category="general", source="user"):
+        """
+        Add a new word or phrase to the database or update if it already exists.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            term (str): The word or phrase to add
+            frequency (int): How common this term is in AI text (1-10)
+            category (str): Category of the term
+            source (str): Source of the term
+        
+        Returns:
+            bool: True if added successfully, False otherwise (uncommitted until flush())
+        """
+        try:
+            with self._write_lock:
+                self._write(_INSERT_TERM_SQL, (kind, term.lower(), frequency, category, source))
+            return True
+        except Exception as e:
+            print(f"Error adding {kind}: {e}")
+            return False
+
     def add_word(self, word, frequency=1, category="general", source="user"):
         """
         Add a new word to the database or update if it already exists.
@@ -62,22 +288,9 @@ class AIWordDatabaseManager:
             source (str): Source of the word (user, research, etc.)
         
         Returns:
-            bool: True if added successfully, False otherwise
+            bool: True if added successfully, False otherwise (uncommitted until flush())
         """
-        try:
-            self.cursor.execute('''
-            INSERT INTO ai_words (word, frequency, category, source)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(word) DO UPDATE SET
-                frequency = excluded.frequency,
-                category = excluded.category,
-                source = excluded.source
-            ''', (word.lower(), frequency, category, source))
-            self.conn.commit()
-            return True
-        except Exception as e:
-            print(f"Error adding word: {e}")
-            return False
+        return self.add_term('word', word, frequency, category, source)
 
     def add_phrase(self, phrase, frequency=1, category="general", source="user"):
         """
@@ -90,21 +303,52 @@ class AIWordDatabaseManager:
             source (str): Source of the phrase
         
         Returns:
-            bool: True if added successfully, False otherwise
+            bool: True if added successfully, False otherwise (uncommitted until flush())
+        """
+        return self.add_term('phrase', phrase, frequency, category, source)
+
+    def _bulk_add(self, kind, rows):
+        """
+        Add or update many words or phrases in a single transaction.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            rows (iterable): Tuples of (text, frequency, category, source); a short list is
+                written as one multi-row INSERT, anything else is consumed lazily by executemany
+        
+        Returns:
+            int: Number of rows written
+        
+        Raises:
+            sqlite3.Error: If the batch failed; none of its rows are written
+        """
+        small = isinstance(rows, list) and 0 < len(rows) <= _MAX_VALUES_ROWS
+        if small:
+            sql = _INSERT_TERMS_SQL.format(values=', '.join([_TERM_VALUES] * len(rows)))
+        rows = ((kind, text.lower(), frequency, category, source) for text, frequency, category, source in rows)
+        with self._batch():
+            if small:
+                count = self._write(sql, list(chain.from_iterable(rows)))
+            else:
+                count = self._write(_INSERT_TERM_SQL, rows, many=True)
+        return count
+
+    def delete_term(self, kind, term):
+        """
+        Delete a word or phrase from the database.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            term (str): The word or phrase to delete
+        
+        Returns:
+            bool: True if deleted successfully, False otherwise (uncommitted until flush())
         """
         try:
-            self.cursor.execute('''
-            INSERT INTO ai_phrases (phrase, frequency, category, source)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(phrase) DO UPDATE SET
-                frequency = excluded.frequency,
-                category = excluded.category,
-                source = excluded.source
-            ''', (phrase.lower(), frequency, category, source))
-            self.conn.commit()
-            return True
+            with self._write_lock:
+                return self._write(_DELETE_TERM_SQL, (kind, term.lower())) > 0
         except Exception as e:
-            print(f"Error adding phrase: {e}")
+            print(f"Error deleting {kind}: {e}")
             return False
 
     def delete_word(self, word):
@@ -115,15 +359,9 @@ class AIWordDatabaseManager:
             word (str): The word to delete
         
         Returns:
-            bool: True if deleted successfully, False otherwise
+            bool: True if deleted successfully, False otherwise (uncommitted until flush())
         """
-        try:
-            self.cursor.execute('DELETE FROM ai_words WHERE word = ?', (word.lower(),))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting word: {e}")
-            return False
+        return self.delete_term('word', word)
 
     def delete_phrase(self, phrase):
         """
@@ -133,50 +371,151 @@ class AIWordDatabaseManager:
             phrase (str): The phrase to delete
         
         Returns:
-            bool: True if deleted successfully, False otherwise
+            bool: True if deleted successfully, False otherwise (uncommitted until flush())
+        """
+        return self.delete_term('phrase', phrase)
+
+    def delete_terms(self, kind, terms):
+        """
+        Delete many words or phrases in a single transaction.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            terms (iterable): The words or phrases to delete, consumed lazily
+        
+        Returns:
+            int: Number of rows deleted, 0 if the batch failed
         """
         try:
-            self.cursor.execute('DELETE FROM ai_phrases WHERE phrase = ?', (phrase.lower(),))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error deleting phrase: {e}")
-            return False
+            with self._batch():
+                count = self._write(_DELETE_TERM_SQL, ((kind, term.lower()) for term in terms), many=True)
+            return count
+        except sqlite3.Error as e:
+            print(f"Error deleting {kind}s: {e}")
+            return 0
 
-    def get_all_words(self, category=None, source=None, min_frequency=None):
+    def delete_words(self, words):
         """
-        Get all words from the database, with optional filtering.
+        Delete many words in a single transaction.
+        
+        Args:
+            words (iterable): The words to delete
+        
+        Returns:
+            int: Number of words deleted
+        """
+        return self.delete_terms('word', words)
+
+    def delete_phrases(self, phrases):
+        """
+        Delete many phrases in a single transaction.
+        
+        Args:
+            phrases (iterable): The phrases to delete
+        
+        Returns:
+            int: Number of phrases deleted
+        """
+        return self.delete_terms('phrase', phrases)
+
+    def iter_terms(self, kind, category=None, source=None, min_frequency=None):
+        """
+        Stream words or phrases from the database in chunks, with optional filtering.
         
         Args:
+            kind (str): Either 'word' or 'phrase'
             category (str, optional): Filter by category
             source (str, optional): Filter by source
             min_frequency (int, optional): Filter by minimum frequency
         
-        Returns:
-            list: List of tuples (word, frequency, category, source)
+        Yields:
+            sqlite3.Row: Records of (term, frequency, category, source), most frequent first
         """
-        query = 'SELECT word, frequency, category, source FROM ai_words'
-        params = []
+        query = 'SELECT term, frequency, category, source FROM ai_terms WHERE kind = ?'
+        params = [kind]
         
         # Add filters if provided
-        conditions = []
         if category:
-            conditions.append('category = ?')
+            query += ' AND category = ?'
             params.append(category)
         if source:
-            conditions.append('source = ?')
+            query += ' AND source = ?'
             params.append(source)
         if min_frequency:
-            conditions.append('frequency >= ?')
+            query += ' AND frequency >= ?'
             params.append(min_frequency)
         
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY frequency DESC, term ASC'
+        
+        # A cursor of its own, so the caller can run other queries while iterating
+        cursor = self._reader().cursor()
+        cursor.arraysize = _FETCH_ROWS
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
+    def get_terms(self, kind, category=None, source=None, min_frequency=None):
+        """
+        Get all words or phrases from the database, with optional filtering.
         
-        query += ' ORDER BY frequency DESC, word ASC'
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            category (str, optional): Filter by category
+            source (str, optional): Filter by source
+            min_frequency (int, optional): Filter by minimum frequency
         
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        Returns:
+            tuple: sqlite3.Row records of (term, frequency, category, source), cached until the data changes
+        """
+        return self._cached(
+            ('terms', kind, category, source, min_frequency),
+            lambda: tuple(self.iter_terms(kind, category, source, min_frequency))
+        )
+
+    def iter_all_words(self, category=None, source=None, min_frequency=None):
+        """
+        Stream words from the database without holding them all in memory.
+        
+        Args:
+            category (str, optional): Filter by category
+            source (str, optional): Filter by source
+            min_frequency (int, optional): Filter by minimum frequency
+        
+        Yields:
+            sqlite3.Row: Records of (word, frequency, category, source)
+        """
+        return self.iter_terms('word', category, source, min_frequency)
+
+    def iter_all_phrases(self, category=None, source=None, min_frequency=None):
+        """
+        Stream phrases from the database without holding them all in memory.
+        
+        Args:
+            category (str, optional): Filter by category
+            source (str, optional): Filter by source
+            min_frequency (int, optional): Filter by minimum frequency
+        
+        Yields:
+            sqlite3.Row: Records of (phrase, frequency, category, source)
+        """
+        return self.iter_terms('phrase', category, source, min_frequency)
+
+    def get_all_words(self, category=None, source=None, min_frequency=None):
+        """
+        Get all words from the database, with optional filtering.
+        
+        Args:
+            category (str, optional): Filter by category
+            source (str, optional): Filter by source
+            min_frequency (int, optional): Filter by minimum frequency
+        
+        Returns:
+            tuple: Rows of (word, frequency, category, source)
+        """
+        return self.get_terms('word', category, source, min_frequency)
 
     def get_all_phrases(self, category=None, source=None, min_frequency=None):
         """
@@ -188,30 +527,94 @@ class AIWordDatabaseManager:
             min_frequency (int, optional): Filter by minimum frequency
         
         Returns:
-            list: List of tuples (phrase, frequency, category, source)
+            tuple: Rows of (phrase, frequency, category, source)
         """
-        query = 'SELECT phrase, frequency, category, source FROM ai_phrases'
-        params = []
+        return self.get_terms('phrase', category, source, min_frequency)
+
+    def get_term_set(self, kind):
+        """
+        Get the words or phrases alone, for fast membership tests.
         
-        # Add filters if provided
-        conditions = []
-        if category:
-            conditions.append('category = ?')
-            params.append(category)
-        if source:
-            conditions.append('source = ?')
-            params.append(source)
-        if min_frequency:
-            conditions.append('frequency >= ?')
-            params.append(min_frequency)
+        Args:
+            kind (str): Either 'word' or 'phrase'
+        
+        Returns:
+            frozenset: The terms, cached until the data changes
+        """
+        return self._cached(('term_set', kind), lambda: frozenset(
+            row[0] for row in self._reader().execute('SELECT term FROM ai_terms WHERE kind = ?', (kind,))
+        ))
+
+    def get_word_set(self):
+        """
+        Get all words as a set, e.g. for `token in manager.get_word_set()` checks.
         
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
+        Returns:
+            frozenset: The words
+        """
+        return self.get_term_set('word')
+
+    def get_phrase_set(self):
+        """
+        Get all phrases as a set.
+        
+        Returns:
+            frozenset: The phrases
+        """
+        return self.get_term_set('phrase')
+
+    def build_matcher(self):
+        """
+        Build an Aho-Corasick automaton over every word and phrase.
         
-        query += ' ORDER BY frequency DESC, phrase ASC'
+        Scanning a document is then a single pass over its text instead of one query
+        per term: `for end, (kind, term) in matcher.iter(text.lower())`. Matches are raw
+        substrings, so callers check word boundaries themselves.
+        
+        Returns:
+            ahocorasick.Automaton: The matcher, cached until the data changes
         
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        Raises:
+            ImportError: If pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            raise ImportError("build_matcher requires pyahocorasick (pip install pyahocorasick)")
+        return self._cached('matcher', self._build_matcher)
+
+    def _build_matcher(self):
+        """Build the automaton for build_matcher()"""
+        automaton = ahocorasick.Automaton()
+        for kind in ('word', 'phrase'):
+            for row in self.iter_terms(kind):
+                automaton.add_word(row[0], (kind, row[0]))
+        automaton.make_automaton()
+        return automaton
+
+    def search_terms(self, kind, search_term):
+        """
+        Search for words or phrases containing the given term.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            search_term (str): Term to search for
+        
+        Returns:
+            list: List of matching terms, most frequent first
+        """
+        # Ties are broken by id, the insertion order the old per-kind tables returned them in
+        if self._fts and len(search_term) >= _FTS_MIN_TERM:
+            # Quoted as an FTS5 string so punctuation in the term is matched literally
+            cursor = self._reader().execute(
+                'SELECT t.term, t.frequency, t.category, t.source FROM ai_terms_fts f '
+                'JOIN ai_terms t ON t.id = f.rowid WHERE ai_terms_fts MATCH ? AND t.kind = ? ORDER BY t.frequency DESC, t.id',
+                ('"' + search_term.replace('"', '""') + '"', kind)
+            )
+        else:
+            cursor = self._reader().execute(
+                "SELECT term, frequency, category, source FROM ai_terms WHERE kind = ? AND term LIKE ? ESCAPE '\\' ORDER BY frequency DESC, id",
+                (kind, '%' + _like_escape(search_term) + '%')
+            )
+        return cursor.fetchall()
 
     def search_words(self, search_term):
         """
@@ -223,11 +626,7 @@ class AIWordDatabaseManager:
         Returns:
             list: List of matching words
         """
-        self.cursor.execute(
-            'SELECT word, frequency, category, source FROM ai_words WHERE word LIKE ? ORDER BY frequency DESC',
-            (f'%{search_term}%',)
-        )
-        return self.cursor.fetchall()
+        return self.search_terms('word', search_term)
 
     def search_phrases(self, search_term):
         """
@@ -239,11 +638,50 @@ class AIWordDatabaseManager:
         Returns:
             list: List of matching phrases
         """
-        self.cursor.execute(
-            'SELECT phrase, frequency, category, source FROM ai_phrases WHERE phrase LIKE ? ORDER BY frequency DESC',
-            (f'%{search_term}%',)
-        )
-        return self.cursor.fetchall()
+        return self.search_terms('phrase', search_term)
+
+    def search_terms_prefix(self, kind, prefix):
+        """
+        Search for words or phrases starting with the given prefix.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+            prefix (str): Prefix to search for
+        
+        Returns:
+            list: List of matching terms, most frequent first
+        """
+        # SQLite only turns LIKE into an index range when the pattern is a bound constant,
+        # so the wildcard is appended here rather than in SQL
+        pattern = _like_escape(prefix) + '%'
+        return self._reader().execute(
+            "SELECT term, frequency, category, source FROM ai_terms WHERE kind = ? AND term LIKE ? ESCAPE '\\' ORDER BY frequency DESC, id",
+            (kind, pattern)
+        ).fetchall()
+
+    def search_words_prefix(self, prefix):
+        """
+        Search for words starting with the given prefix.
+        
+        Args:
+            prefix (str): Prefix to search for
+        
+        Returns:
+            list: List of matching words
+        """
+        return self.search_terms_prefix('word', prefix)
+
+    def search_phrases_prefix(self, prefix):
+        """
+        Search for phrases starting with the given prefix.
+        
+        Args:
+            prefix (str): Prefix to search for
+        
+        Returns:
+            list: List of matching phrases
+        """
+        return self.search_terms_prefix('phrase', prefix)
 
     def import_from_csv(self, file_path, table_type):
         """
@@ -260,40 +698,50 @@ class AIWordDatabaseManager:
             return False, f"File not found: {file_path}"
         
         try:
-            df = pd.read_csv(file_path)
-            
-            if table_type == 'words':
-                required_columns = ['word', 'frequency']
-                if all(col in df.columns for col in required_columns):
-                    count = 0
-                    for _, row in df.iterrows():
-                        category = row.get('category', 'general')
-                        source = row.get('source', 'csv_import')
-                        if self.add_word(row['word'], row['frequency'], category, source):
-                            count += 1
-                    return True, f"Successfully imported {count} words"
-                else:
-                    return False, "CSV must have columns: word, frequency (optional: category, source)"
-            
-            elif table_type == 'phrases':
-                required_columns = ['phrase', 'frequency']
-                if all(col in df.columns for col in required_columns):
-                    count = 0
-                    for _, row in df.iterrows():
-                        category = row.get('category', 'general')
-                        source = row.get('source', 'csv_import')
-                        if self.add_phrase(row['phrase'], row['frequency'], category, source):
-                            count += 1
-                    return True, f"Successfully imported {count} phrases"
+            with open(file_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                columns = next(reader, [])
+                
+                if table_type == 'words':
+                    required_columns = ['word', 'frequency']
+                    if all(col in columns for col in required_columns):
+                        count = self._bulk_add('word', self._csv_rows(reader, columns, 'word'))
+                        return True, f"Successfully imported {count} words"
+                    else:
+                        return False, "CSV must have columns: word, frequency (optional: category, source)"
+                
+                elif table_type == 'phrases':
+                    required_columns = ['phrase', 'frequency']
+                    if all(col in columns for col in required_columns):
+                        count = self._bulk_add('phrase', self._csv_rows(reader, columns, 'phrase'))
+                        return True, f"Successfully imported {count} phrases"
+                    else:
+                        return False, "CSV must have columns: phrase, frequency (optional: category, source)"
+                
                 else:
-                    return False, "CSV must have columns: phrase, frequency (optional: category, source)"
-            
-            else:
-                return False, "Invalid table_type. Use 'words' or 'phrases'"
+                    return False, "Invalid table_type. Use 'words' or 'phrases'"
         
         except Exception as e:
             return False, f"Error importing from CSV: {str(e)}"
 
+    def _csv_rows(self, reader, columns, column):
+        """Lazily turn CSV records into (text, frequency, category, source) rows, skipping blank terms"""
+        # Missing optional columns read as blank, like the cells of short records
+        header_width = len(columns)
+        columns = columns + [name for name in ('category', 'source') if name not in columns]
+        width = len(columns)
+        # Pull the four fields by position in one C call instead of building a dict per record
+        pick = itemgetter(*map(columns.index, (column, 'frequency', 'category', 'source')))
+        for record in reader:
+            if len(record) != header_width or width != header_width:
+                if not record:
+                    continue
+                # Cells beyond the header are ignored, as DictReader did
+                record = record[:header_width] + [''] * (width - min(len(record), header_width))
+            text, frequency, category, source = pick(record)
+            if text:
+                yield text, int(frequency), category or 'general', source or 'csv_import'
+
     def export_to_csv(self, file_path, table_type):
         """
         Export words or phrases to a CSV file.
@@ -307,16 +755,12 @@ class AIWordDatabaseManager:
         """
         try:
             if table_type == 'words':
-                words = self.get_all_words()
-                df = pd.DataFrame(words, columns=['word', 'frequency', 'category', 'source'])
-                df.to_csv(file_path, index=False)
-                return True, f"Successfully exported {len(words)} words to {file_path}"
+                count = self._write_csv(file_path, 'word')
+                return True, f"Successfully exported {count} words to {file_path}"
             
             elif table_type == 'phrases':
-                phrases = self.get_all_phrases()
-                df = pd.DataFrame(phrases, columns=['phrase', 'frequency', 'category', 'source'])
-                df.to_csv(file_path, index=False)
-                return True, f"Successfully exported {len(phrases)} phrases to {file_path}"
+                count = self._write_csv(file_path, 'phrase')
+                return True, f"Successfully exported {count} phrases to {file_path}"
             
             else:
                 return False, "Invalid table_type. Use 'words' or 'phrases'"
@@ -324,6 +768,18 @@ class AIWordDatabaseManager:
         except Exception as e:
             return False, f"Error exporting to CSV: {str(e)}"
 
+    def _write_csv(self, file_path, kind):
+        """Stream the words or phrases to CSV straight from the cursor and return the row count"""
+        conn = self._reader()
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow((kind, 'frequency', 'category', 'source'))
+            writer.writerows(conn.execute(
+                'SELECT term, frequency, category, source FROM ai_terms WHERE kind = ? ORDER BY frequency DESC, term ASC',
+                (kind,)
+            ))
+        return conn.execute('SELECT COUNT(*) FROM ai_terms WHERE kind = ?', (kind,)).fetchone()[0]
+
     def populate_default_data(self):
         """
         Populate the database with default AI words and phrases.
@@ -409,51 +865,84 @@ class AIWordDatabaseManager:
             ("paradigm shift", 5, "description", "GPTZero"),
         ]
         
-        words_added = 0
-        for word, frequency, category, source in default_words:
-            if self.add_word(word, frequency, category, source):
-                words_added += 1
-        
-        phrases_added = 0
-        for phrase, frequency, category, source in default_phrases:
-            if self.add_phrase(phrase, frequency, category, source):
-                phrases_added += 1
+        added = []
+        for kind, rows in (('word', default_words), ('phrase', default_phrases)):
+            try:
+                added.append(self._bulk_add(kind, rows))
+            except sqlite3.Error as e:
+                print(f"Error adding {kind}s: {e}")
+                added.append(0)
+        words_added, phrases_added = added
         
         return words_added, phrases_added
 
+    def get_categories(self, kind):
+        """
+        Get all unique word or phrase categories in the database.
+        
+        Args:
+            kind (str): Either 'word' or 'phrase'
+        
+        Returns:
+            tuple: Categories, cached until the data changes
+        """
+        return self._cached(('categories', kind), lambda: tuple(
+            row[0] for row in self._reader().execute('SELECT DISTINCT category FROM ai_terms WHERE kind = ? ORDER BY category', (kind,))
+        ))
+
     def get_word_categories(self):
         """
         Get all unique word categories in the database.
         
         Returns:
-            list: List of categories
+            tuple: Categories
         """
-        self.cursor.execute('SELECT DISTINCT category FROM ai_words ORDER BY category')
-        return [row[0] for row in self.cursor.fetchall()]
+        return self.get_categories('word')
 
     def get_phrase_categories(self):
         """
         Get all unique phrase categories in the database.
         
         Returns:
-            list: List of categories
+            tuple: Categories
         """
-        self.cursor.execute('SELECT DISTINCT category FROM ai_phrases ORDER BY category')
-        return [row[0] for row in self.cursor.fetchall()]
+        return self.get_categories('phrase')
     
     def get_sources(self):
         """
         Get all unique sources in the database.
         
         Returns:
-            list: List of sources
+            tuple: Sources, cached until the data changes
+        """
+        return self._cached('sources', lambda: tuple(
+            row[0] for row in self._reader().execute('SELECT DISTINCT source FROM ai_terms ORDER BY source')
+        ))
+
+    def load_in_memory(self):
         """
-        self.cursor.execute('SELECT DISTINCT source FROM ai_words UNION SELECT DISTINCT source FROM ai_phrases ORDER BY source')
-        return [row[0] for row in self.cursor.fetchall()]
+        Serve all further queries from a read-only copy of the database in RAM.
+        
+        Useful for read-heavy detection, where lookups then never touch the file.
+        Writes still go to the file through `conn`, so `with manager.conn:` commits
+        them as before; the first query after a write, by this manager or any other
+        connection, re-copies the file.
+        """
+        with self._write_lock:
+            if self._memory is None:
+                # A backup can't start while the connection has uncommitted changes
+                self.conn.commit()
+                self._copy_to_memory()
+
+    def flush(self):
+        """Commit any pending single-row changes"""
+        with self._write_lock:
+            self.conn.commit()
 
     def close(self):
-        """Close the database connection"""
+        """Commit pending changes and close the database connection"""
         if self.conn:
+            self.flush()
             self.conn.close()
 
 # Example usage
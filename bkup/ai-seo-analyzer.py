@@ -1,21 +1,329 @@
 import re
+import bisect
+import heapq
 import sqlite3
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import csv
 from collections import Counter
+from itertools import accumulate, chain, islice
+from operator import itemgetter
 import argparse
 import sys
 import os
+import shutil
+import tempfile
 import json
+import string
+import hashlib
+import time
+import weakref
 from datetime import datetime
+from html import escape
+
+try:
+    import ahocorasick
+except ImportError:  # pip install pyahocorasick
+    ahocorasick = None
+
+# Bumped whenever setup_database changes the schema (stored in PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# Words and phrases share ai_terms with ai-word-sql-manager.py; re-adding a term updates it
+_INSERT_TERM_SQL = '''
+INSERT INTO ai_terms (kind, term, frequency, category, source) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(kind, term) DO UPDATE SET
+    frequency = excluded.frequency, category = excluded.category, source = excluded.source
+'''
+# Table and text column each kind was kept in before ai_terms
+_LEGACY_TABLES = {'word': ('ai_words', 'word'), 'phrase': ('ai_phrases', 'phrase')}
+
+# Text statistics: words, and sentences (text between terminators that is not only whitespace)
+_WORD_TOKEN_RE = re.compile(r'\w+')
+_SENTENCE_RE = re.compile(r'[^\s.!?][^.!?]*')
+
+# Texts at least this long are split into windows, and the fused regex only scans
+# windows containing the first word of some marker
+_PREFILTER_MIN_LENGTH = 1 << 16
+_PREFILTER_WINDOW = 4096
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Pattern sets at least this large are matched through a first-word index instead of
+# one huge regex alternation, which slows down with every branch added
+_INDEX_MIN_MARKERS = 5000
+
+# Analysis history rows are buffered and written in one transaction once this many are
+# waiting or the oldest has waited this many seconds, so the write lock is only held briefly
+_HISTORY_BATCH_ROWS = 100
+_HISTORY_BATCH_SECONDS = 5.0
+
+# Reports show this many of the most frequent words and phrases
+_TOP_K = 10
+
+# Containment filtering is handed to a Numba kernel (when installed) once there are
+# enough word matches to outweigh the array conversion
+_NUMBA_MIN_MATCHES = 4096
+_np = None
+_containment_kernel = None
+
+# ASCII word characters, checked with a set lookup before falling back to Unicode properties
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+
+def _is_word_char(char):
+    """Same definition of a word character as the regex \\w class"""
+    if char in _ASCII_WORD_CHARS:
+        return True
+    return char > "\x7f" and char.isalnum()
+
+
+def _lower_preserving_offsets(text):
+    """Lowercase text without changing its length, so match offsets map back to the original"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') lowercase to several code points; keep only the first
+    return "".join(c.lower()[0] for c in text)
+
+
+def _candidate_spans(text, first_tokens, extend):
+    """
+    Yield (start, end, endpos) spans of text that may contain a marker.
+    
+    Windows end on whitespace so no word is split; consecutive windows holding one of
+    first_tokens are merged into [start, end), and endpos = end + extend leaves room for
+    markers that start inside the span but run past its end.
+    """
+    length = len(text)
+    span_start = span_end = None
+    pos = 0
+    while pos < length:
+        split = _WHITESPACE_RE.search(text, min(pos + _PREFILTER_WINDOW, length))
+        end = split.start() if split else length
+        if not first_tokens.isdisjoint(_WORD_TOKEN_RE.findall(text, pos, end)):
+            if span_end == pos:
+                span_end = end
+            else:
+                if span_start is not None:
+                    yield span_start, span_end, min(span_end + extend, length)
+                span_start, span_end = pos, end
+        pos = end
+    if span_start is not None:
+        yield span_start, span_end, min(span_end + extend, length)
+
+
+def _words_outside_phrases(word_starts, word_ends, phrase_starts, phrase_reach):
+    """Mask of word matches not contained in a phrase (compiled by _get_containment_kernel)"""
+    keep = _np.empty(word_starts.shape[0], dtype=_np.bool_)
+    for k in range(word_starts.shape[0]):
+        i = _np.searchsorted(phrase_starts, word_starts[k], side='right') - 1
+        keep[k] = i < 0 or phrase_reach[i] < word_ends[k]
+    return keep
+
+
+def _get_containment_kernel():
+    """JIT-compile (once) _words_outside_phrases; returns None if numba is not installed"""
+    global _np, _containment_kernel
+    if _containment_kernel is None:
+        try:
+            import numpy
+            from numba import njit  # pip install numba
+        except ImportError:
+            _containment_kernel = False
+        else:
+            _np = numpy
+            _containment_kernel = njit(cache=True)(_words_outside_phrases)
+    return _containment_kernel or None
+
+
+def _find_indexed(text, markers, index):
+    """
+    Yield (start, end, marker) like the fused regex would, using the first-word index.
+    
+    Every marker starts with a word character, so a match can only begin where a word
+    begins; every candidate for that word is tried, so overlapping markers are all found.
+    """
+    length = len(text)
+    for token in _WORD_TOKEN_RE.finditer(text):
+        start = token.start()
+        candidates = index.get(token.group(0))
+        if candidates is None:
+            continue
+        for key in candidates:
+            end = start + len(key)
+            if not text.startswith(key, start):
+                continue
+            # Same rule as the trailing r'\b'
+            after = end < length and _is_word_char(text[end])
+            if after != _is_word_char(key[-1]):
+                yield start, end, markers[key]
+
+
+def _find_fused(text, pattern, markers, prefixes, spans):
+    """
+    Yield (start, end, marker) for every match of the fused lookahead pattern in spans.
+    
+    The lookahead reports the longest marker at each start position without consuming
+    it; shorter markers that are prefixes of it are checked against the trailing r'\b'.
+    """
+    length = len(text)
+    for span_start, span_end, endpos in spans:
+        for match in pattern.finditer(text, span_start, endpos):
+            start = match.start()
+            # Later matches belong to the next span
+            if start >= span_end:
+                break
+            key = match.group(1)
+            yield start, start + len(key), markers[key]
+            for prefix in prefixes.get(key, ()):
+                end = start + len(prefix)
+                after = end < length and _is_word_char(text[end])
+                if after != _is_word_char(prefix[-1]):
+                    yield start, end, markers[prefix]
+
+
+def _drop_contained_words(phrase_spans, word_matches):
+    """Yield the word matches that are not part of any (start, end) phrase span"""
+    # Find the phrases starting at or before the word with a bisect, then compare
+    # against the furthest end they reach
+    phrase_spans.sort()
+    phrase_starts = [start for start, _ in phrase_spans]
+    phrase_reach = list(accumulate((end for _, end in phrase_spans), max))
+    
+    kernel = _get_containment_kernel() if len(word_matches) >= _NUMBA_MIN_MATCHES else None
+    if kernel is not None:
+        count = len(word_matches)
+        keep = kernel(
+            _np.fromiter((match[0] for match in word_matches), _np.int64, count),
+            _np.fromiter((match[1] for match in word_matches), _np.int64, count),
+            _np.array(phrase_starts, dtype=_np.int64),
+            _np.array(phrase_reach, dtype=_np.int64)
+        )
+        for match, kept in zip(word_matches, keep):
+            if kept:
+                yield match
+        return
+    
+    for match in word_matches:
+        i = bisect.bisect_right(phrase_starts, match[0]) - 1
+        if i < 0 or phrase_reach[i] < match[1]:
+            yield match
+
+
+def _top_counts(counts, k=_TOP_K):
+    """(key, count) pairs of the k largest counts, ordered like a stable descending sort"""
+    # O(n log k) selection; equivalent to sorted(..., reverse=True)[:k], ties included
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+_pyplot = None
+
+
+def _get_pyplot():
+    """Import pyplot (once) on the non-interactive Agg backend with the report style set"""
+    global _pyplot
+    if _pyplot is None:
+        if "matplotlib.pyplot" not in sys.modules:
+            import matplotlib
+            # Charts are only saved to files, so skip the GUI backend autodetection
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        plt.style.use('seaborn-v0_8-whitegrid')
+        _pyplot = plt
+    return _pyplot
+
+
+def _marker_item(text, start, end, marker):
+    """Expand a (start, end, marker) match from _scan into a found-item dict"""
+    item_type, marker_text, frequency, category, source = marker
+    return {
+        "type": item_type,
+        "text": marker_text,
+        "original_text": text[start:end],
+        "start": start,
+        "end": end,
+        "frequency": frequency,
+        "category": category,
+        "source": source
+    }
+
+
+def _write_history(conn, rows):
+    """Insert buffered analysis history rows in one transaction, emptying the buffer"""
+    if not rows:
+        return
+    # Emptied in place, since the analyzer's finalizer holds the same list
+    pending = rows[:]
+    rows.clear()
+    try:
+        with conn:
+            conn.executemany(
+                'INSERT INTO analysis_history (text_hash, timestamp, total_words, ai_markers, ai_percentage, results) VALUES (?, ?, ?, ?, ?, ?)',
+                pending
+            )
+    except Exception as e:
+        print(f"Error saving analysis: {e}")
+
+
+# Common AI words and suggested replacements
+_WORD_REPLACEMENTS = {
+    "delve": ["explore", "examine", "investigate", "look into"],
+    "whilst": ["while", "as", "during", "when"],
+    "furthermore": ["also", "besides", "plus", "in addition"],
+    "utilize": ["use", "apply", "employ"],
+    "leverage": ["use", "apply", "employ", "harness"],
+    "robust": ["strong", "solid", "durable", "powerful"],
+    "optimal": ["best", "ideal", "perfect", "prime"],
+    "essentially": ["basically", "mainly", "primarily", "at heart"],
+    "ultimately": ["finally", "in the end", "eventually", "in conclusion"],
+    "myriad": ["many", "numerous", "countless", "various"],
+    "seamless": ["smooth", "flawless", "perfect", "uninterrupted"],
+    "plethora": ["abundance", "wealth", "excess", "plenty"],
+    "harness": ["use", "utilize", "channel", "direct"],
+    "elevate": ["raise", "lift", "boost", "improve"],
+    "tapestry": ["mixture", "blend", "fabric", "collection"],
+    "captivate": ["engage", "entrance", "fascinate", "charm"],
+    "testament": ["proof", "evidence", "example", "demonstration"]
+}
+
+# Common AI phrases and suggested replacements
+_PHRASE_REPLACEMENTS = {
+    "in this article": ["here", "in these pages", "below", "in what follows"],
+    "delve into": ["explore", "examine", "look at", "investigate"],
+    "it's important to note": ["note that", "remember", "keep in mind", "be aware"],
+    "on the other hand": ["however", "conversely", "in contrast", "alternatively"],
+    "in the realm of": ["in", "within", "concerning", "regarding"],
+    "a wide range of": ["many", "various", "diverse", "different"],
+    "it is worth mentioning": ["notably", "interestingly", "remarkably"],
+    "plays a crucial role": ["is important for", "is vital to", "is key to"],
+    "in conclusion": ["to wrap up", "finally", "to sum up", "in closing"],
+    "in summary": ["in short", "to recap", "in brief", "to summarize briefly"],
+    "when it comes to": ["regarding", "about", "concerning", "on the topic of"],
+    "as mentioned earlier": ["as I said", "as noted", "as stated above"]
+}
+
+# Row of the word/phrase tables in the HTML report: text, count, frequency score, category
+_TABLE_ROW = """
+                    <tr>
+                        <td>{}</td>
+                        <td>{}</td>
+                        <td>{}</td>
+                        <td>{}</td>
+                    </tr>
+                """
+
+# Replacement lists as they appear in the reports, joined once
+_WORD_REPLACEMENT_TEXT = {word: ", ".join(replacements) for word, replacements in _WORD_REPLACEMENTS.items()}
+_PHRASE_REPLACEMENT_TEXT = {phrase: ", ".join(replacements) for phrase, replacements in _PHRASE_REPLACEMENTS.items()}
+
 
 class AIContentAnalyzer:
     """
     A comprehensive tool for analyzing text to detect AI-generated content
     patterns and provide SEO optimization suggestions.
     """
+
+    __slots__ = ("db_path", "conn", "cursor", "_automaton", "_pattern_cache", "_fused_patterns", "_data_version",
+                 "_history_rows", "_history_since", "_html_open", "_fig", "_gauge_cache_dir", "_category_color_cache",
+                 "__weakref__")
     
     def __init__(self, db_path=None):
         """
@@ -31,14 +339,56 @@ class AIContentAnalyzer:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self._automaton = None
+        # Word/phrase rows keyed by query filters; cleared whenever the data changes
+        self._pattern_cache = {}
+        # PRAGMA data_version the caches were built at, to notice other connections' writes
+        self._data_version = None
+        # (fused regex, marker lookup) per highlight threshold, used without pyahocorasick
+        self._fused_patterns = {}
+        # Analysis history rows waiting for flush(), and when the first of them was saved
+        self._history_rows = []
+        self._history_since = 0.0
+        # Opening <span> for each marker, formatted the first time it is highlighted
+        self._html_open = {}
+        # Figure reused by visualize_analysis for every chart
+        self._fig = None
+        # Rendered score gauges, shared between runs; bump the suffix when the chart changes
+        # (v1 held gauges saved with a tight bounding box, before the fixed-size output)
+        self._gauge_cache_dir = os.path.join(tempfile.gettempdir(), "ai_gauge_cache_v2")
+        # Category pie colors keyed by the number of categories
+        self._category_color_cache = {}
         self.connect_database()
     
+    def warm_up(self):
+        """
+        Compile the optional Numba kernel now instead of on the first large scan.
+        
+        Not called by the constructor, so numpy and numba are only imported once a
+        scan needs them; long-running callers can call it up front.
+        """
+        kernel = _get_containment_kernel()
+        if kernel is not None:
+            # With cache=True this loads the compiled kernel from disk after the first run
+            empty = _np.zeros(0, dtype=_np.int64)
+            kernel(empty, empty, empty, empty)
+    
     def connect_database(self):
         """Connect to the SQLite database"""
         try:
             self.conn = sqlite3.connect(self.db_path)
+            # WAL lets readers and the writer proceed concurrently, and NORMAL sync
+            # drops the fsync from every commit
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-65536")
+            self.conn.execute("PRAGMA busy_timeout=5000")
             self.cursor = self.conn.cursor()
             self.setup_database()
+            # Rows still buffered when the analyzer is garbage collected, or when the
+            # interpreter exits without close(), are written then
+            weakref.finalize(self, _write_history, self.conn, self._history_rows)
             return True
         except Exception as e:
             print(f"Error connecting to database: {e}")
@@ -46,53 +396,62 @@ class AIContentAnalyzer:
     
     def setup_database(self):
         """Create necessary tables if they don't exist"""
-        # Create table for AI words
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_words (
-            id INTEGER PRIMARY KEY,
-            word TEXT UNIQUE NOT NULL,
-            frequency INTEGER DEFAULT 1,
-            category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
-        )
-        ''')
-        
-        # Create table for AI phrases
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ai_phrases (
-            id INTEGER PRIMARY KEY,
-            phrase TEXT UNIQUE NOT NULL,
-            frequency INTEGER DEFAULT 1,
-            category TEXT DEFAULT 'general',
-            source TEXT DEFAULT 'default'
-        )
-        ''')
-        
-        # Create indices for faster lookups
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_word ON ai_words(word)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_phrase ON ai_phrases(phrase)')
-        
-        # Create table for analysis history
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS analysis_history (
-            id INTEGER PRIMARY KEY,
-            text_hash TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            total_words INTEGER,
-            ai_markers INTEGER,
-            ai_percentage REAL,
-            results TEXT  -- JSON string of analysis results
-        )
-        ''')
+        # Databases already set up by this schema version need no DDL or row counts
+        self.cursor.execute('PRAGMA user_version')
+        if self.cursor.fetchone()[0] == SCHEMA_VERSION:
+            return
         
-        self.conn.commit()
+        with self.conn:
+            # DDL does not open a transaction implicitly, so start one for all of it
+            self.cursor.execute('BEGIN')
+            
+            self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ai_terms'")
+            created = self.cursor.fetchone() is None
+            
+            # One table for AI words and phrases, told apart by kind
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ai_terms (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL CHECK(kind IN ('word', 'phrase')),
+                term TEXT NOT NULL,
+                frequency INTEGER DEFAULT 1,
+                category TEXT DEFAULT 'general',
+                source TEXT DEFAULT 'default',
+                UNIQUE(kind, term)
+            )
+            ''')
+            
+            # Copy terms from databases set up before ai_terms (lowercased, first row wins)
+            if created:
+                for kind, (table, column) in _LEGACY_TABLES.items():
+                    self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+                    if self.cursor.fetchone() is not None:
+                        self.cursor.execute(f'''
+                        INSERT OR IGNORE INTO ai_terms (kind, term, frequency, category, source)
+                        SELECT ?, lower({column}), frequency, category, source FROM {table} ORDER BY id
+                        ''', (kind,))
+            
+            # Create table for analysis history
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_history (
+                id INTEGER PRIMARY KEY,
+                text_hash TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                total_words INTEGER,
+                ai_markers INTEGER,
+                ai_percentage REAL,
+                results TEXT  -- JSON string of analysis results
+            )
+            ''')
         
         # Check if we need to populate default data
-        self.cursor.execute('SELECT COUNT(*) FROM ai_words')
+        self.cursor.execute("SELECT COUNT(*) FROM ai_terms WHERE kind = 'word'")
         word_count = self.cursor.fetchone()[0]
         
         if word_count == 0:
             self.populate_default_data()
+        
+        self.cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
     
     def populate_default_data(self):
         """Populate the database with default AI words and phrases"""
@@ -192,29 +551,25 @@ class AIContentAnalyzer:
             ("I cannot browse the internet", 8, "limitation", "Various"),
         ]
         
-        # Insert words
+        # Insert words and phrases, lowercased like every other write; existing terms are kept
         self.cursor.executemany(
-            'INSERT OR IGNORE INTO ai_words (word, frequency, category, source) VALUES (?, ?, ?, ?)',
-            default_words
-        )
-        
-        # Insert phrases
-        self.cursor.executemany(
-            'INSERT OR IGNORE INTO ai_phrases (phrase, frequency, category, source) VALUES (?, ?, ?, ?)',
-            default_phrases
+            'INSERT OR IGNORE INTO ai_terms (kind, term, frequency, category, source) VALUES (?, ?, ?, ?, ?)',
+            chain(
+                (("word", word.lower(), frequency, category, source) for word, frequency, category, source in default_words),
+                (("phrase", phrase.lower(), frequency, category, source) for phrase, frequency, category, source in default_phrases)
+            )
         )
         
         self.conn.commit()
+        self._invalidate_patterns()
         print(f"Added {len(default_words)} words and {len(default_phrases)} phrases to the database")
     
     def add_word(self, word, frequency=1, category="general", source="user"):
         """Add a new AI word to the database"""
         try:
-            self.cursor.execute(
-                'INSERT OR REPLACE INTO ai_words (word, frequency, category, source) VALUES (?, ?, ?, ?)',
-                (word.lower(), frequency, category, source)
-            )
+            self.cursor.execute(_INSERT_TERM_SQL, ("word", word.lower(), frequency, category, source))
             self.conn.commit()
+            self._invalidate_patterns()
             return True
         except Exception as e:
             print(f"Error adding word: {e}")
@@ -223,63 +578,93 @@ class AIContentAnalyzer:
     def add_phrase(self, phrase, frequency=1, category="general", source="user"):
         """Add a new AI phrase to the database"""
         try:
-            self.cursor.execute(
-                'INSERT OR REPLACE INTO ai_phrases (phrase, frequency, category, source) VALUES (?, ?, ?, ?)',
-                (phrase.lower(), frequency, category, source)
-            )
+            self.cursor.execute(_INSERT_TERM_SQL, ("phrase", phrase.lower(), frequency, category, source))
             self.conn.commit()
+            self._invalidate_patterns()
             return True
         except Exception as e:
             print(f"Error adding phrase: {e}")
             return False
 
+    def add_words_batch(self, rows):
+        """Add many (word, frequency, category, source) rows in one transaction"""
+        try:
+            with self.conn:
+                self.cursor.executemany(
+                    _INSERT_TERM_SQL,
+                    (("word", word.lower(), frequency, category, source) for word, frequency, category, source in rows)
+                )
+            self._invalidate_patterns()
+            return True
+        except Exception as e:
+            print(f"Error adding words: {e}")
+            return False
+
+    def add_phrases_batch(self, rows):
+        """Add many (phrase, frequency, category, source) rows in one transaction"""
+        try:
+            with self.conn:
+                self.cursor.executemany(
+                    _INSERT_TERM_SQL,
+                    (("phrase", phrase.lower(), frequency, category, source) for phrase, frequency, category, source in rows)
+                )
+            self._invalidate_patterns()
+            return True
+        except Exception as e:
+            print(f"Error adding phrases: {e}")
+            return False
+
+    def _invalidate_patterns(self):
+        """Drop cached word/phrase rows and compiled matchers after the data changes"""
+        self._pattern_cache.clear()
+        self._fused_patterns.clear()
+        self._html_open.clear()
+        self._automaton = None
+
+    def _check_data_version(self):
+        """Drop the cached patterns if another connection (e.g. the manager) committed since they were built"""
+        # Our own writes don't move data_version; they invalidate the patterns directly
+        data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            self._invalidate_patterns()
+            self._data_version = data_version
+
     def get_all_words(self, category=None, source=None, min_frequency=None):
-        """Get all AI words with optional filtering"""
-        query = 'SELECT word, frequency, category, source FROM ai_words'
-        params = []
-        
-        conditions = []
-        if category:
-            conditions.append('category = ?')
-            params.append(category)
-        if source:
-            conditions.append('source = ?')
-            params.append(source)
-        if min_frequency:
-            conditions.append('frequency >= ?')
-            params.append(min_frequency)
-        
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
-        
-        query += ' ORDER BY frequency DESC'
-        
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        """Get all AI words with optional filtering (cached until the data changes)"""
+        self._check_data_version()
+        return self._get_terms("word", category, source, min_frequency)
 
     def get_all_phrases(self, category=None, source=None, min_frequency=None):
-        """Get all AI phrases with optional filtering"""
-        query = 'SELECT phrase, frequency, category, source FROM ai_phrases'
-        params = []
+        """Get all AI phrases with optional filtering (cached until the data changes)"""
+        self._check_data_version()
+        return self._get_terms("phrase", category, source, min_frequency)
+
+    def _get_terms(self, kind, category, source, min_frequency):
+        """(term, frequency, category, source) rows of one kind, most frequent first, from the cache if present"""
+        cache_key = (kind, category, source, min_frequency)
+        if cache_key in self._pattern_cache:
+            return self._pattern_cache[cache_key]
+        
+        query = 'SELECT term, frequency, category, source FROM ai_terms WHERE kind = ?'
+        params = [kind]
         
-        conditions = []
         if category:
-            conditions.append('category = ?')
+            query += ' AND category = ?'
             params.append(category)
         if source:
-            conditions.append('source = ?')
+            query += ' AND source = ?'
             params.append(source)
         if min_frequency:
-            conditions.append('frequency >= ?')
+            query += ' AND frequency >= ?'
             params.append(min_frequency)
         
-        if conditions:
-            query += ' WHERE ' + ' AND '.join(conditions)
-        
-        query += ' ORDER BY frequency DESC'
+        # Ties keep insertion order
+        query += ' ORDER BY frequency DESC, id'
         
         self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        rows = self.cursor.fetchall()
+        self._pattern_cache[cache_key] = rows
+        return rows
 
     def highlight_text(self, text, output_format='html', highlight_threshold=1):
         """
@@ -293,144 +678,253 @@ class AIContentAnalyzer:
         Returns:
             tuple: (highlighted text, list of found AI markers)
         """
-        # Get all words and phrases
-        words = self.get_all_words(min_frequency=highlight_threshold)
-        phrases = self.get_all_phrases(min_frequency=highlight_threshold)
-        
-        # Create a copy of the text for highlighting
-        highlighted_text = text
-        found_items = []
-        
-        # First detect phrases (to avoid highlighting parts of phrases as individual words)
-        for phrase, frequency, category, source in phrases:
-            pattern = r'\b' + re.escape(phrase) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                found_items.append({
-                    "type": "phrase",
-                    "text": phrase,
-                    "original_text": match.group(0),
-                    "start": match.start(),
-                    "end": match.end(),
-                    "frequency": frequency,
-                    "category": category,
-                    "source": source
-                })
-        
-        # Then detect individual words
-        for word, frequency, category, source in words:
-            pattern = r'\b' + re.escape(word) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Check if this word is part of a detected phrase
-                is_part_of_phrase = False
-                for item in found_items:
-                    if item["type"] == "phrase" and item["start"] <= match.start() and match.end() <= item["end"]:
-                        is_part_of_phrase = True
-                        break
-                
-                if not is_part_of_phrase:
-                    found_items.append({
-                        "type": "word",
-                        "text": word,
-                        "original_text": match.group(0),
-                        "start": match.start(),
-                        "end": match.end(),
-                        "frequency": frequency,
-                        "category": category,
-                        "source": source
-                    })
-        
-        # Sort found items by position (start index) in reverse order
-        found_items.sort(key=lambda x: x["start"], reverse=True)
-        
-        # Replace matches with highlighted versions
-        for item in found_items:
-            original_text = item["original_text"]
+        matches = list(self._scan(text, highlight_threshold))
+        
+        # Sort matches by position (longest first on ties) and build the output in one pass
+        matches.sort(key=lambda x: (x[0], -x[1]))
+        
+        # Pick the wrapping once: an opening tag per distinct marker and a shared closing tag
+        distinct = {marker for _, _, marker in matches}
+        if output_format == 'html':
+            open_tags = self._html_open
+            for marker in distinct:
+                if marker not in open_tags:
+                    _, marker_text, frequency, category, _ = marker
+                    frequency = escape(str(frequency))
+                    open_tags[marker] = (f'<span class="ai-marker ai-freq-{frequency}" '
+                                         f'title="{escape(marker_text)} ({escape(str(category))}, freq: {frequency})">')
+            close_tag = '</span>'
+            # The input text and the markers may contain markup characters
+            quote = escape
+        elif output_format == 'markdown':
+            open_tags, close_tag, quote = dict.fromkeys(distinct, '**'), '**', str
+        else:  # plain
+            open_tags, close_tag, quote = dict.fromkeys(distinct, '[AI:'), ']', str
+        
+        out = []
+        cursor = 0
+        for start, end, marker in matches:
+            # Skip matches overlapping one that is already highlighted
+            if start < cursor:
+                continue
+            out.append(quote(text[cursor:start]))
+            out.append(open_tags[marker])
+            out.append(quote(text[start:end]))
+            out.append(close_tag)
+            cursor = end
+        out.append(quote(text[cursor:]))
+        highlighted_text = "".join(out)
+        
+        found_items = [_marker_item(text, start, end, marker) for start, end, marker in matches]
+        return highlighted_text, found_items
+
+    def _scan(self, text, highlight_threshold=None):
+        """
+        Yield (start, end, marker) for each AI marker found in text, in no particular order.
+        
+        marker is the shared (type, text, frequency, category, source) tuple of the
+        matched word or phrase, so scanning allocates nothing per match beyond the triple.
+        """
+        self._check_data_version()
+        # Match against lowercased text; offsets map back to the original for output
+        text_lc = _lower_preserving_offsets(text)
+        if ahocorasick is not None:
+            return self._find_markers_automaton(text, text_lc, highlight_threshold)
+        return self._find_markers_regex(text, text_lc, highlight_threshold)
+
+    def _get_automaton(self):
+        """Build (once) an Aho-Corasick automaton over all lowercased AI words and phrases"""
+        if self._automaton is None:
+            automaton = ahocorasick.Automaton()
+            # Phrases are added last so they win when the same text is stored as both
+            for word, frequency, category, source in self._get_terms("word", None, None, None):
+                key = word.lower()
+                automaton.add_word(key, (len(key), ("word", word, frequency, category, source)))
+            for phrase, frequency, category, source in self._get_terms("phrase", None, None, None):
+                key = phrase.lower()
+                automaton.add_word(key, (len(key), ("phrase", phrase, frequency, category, source)))
+            if len(automaton) > 0:
+                automaton.make_automaton()
+            self._automaton = automaton
+        return self._automaton
+
+    def _find_markers_automaton(self, text, text_lc, highlight_threshold):
+        """Find AI markers with a single Aho-Corasick pass over the text"""
+        automaton = self._get_automaton()
+        if len(automaton) == 0:
+            return
+        
+        text_length = len(text)
+        phrase_spans = []
+        word_matches = []
+        for last, (length, marker) in automaton.iter(text_lc):
+            # A NULL frequency never meets the threshold (SQL's frequency >= ? drops it too)
+            if highlight_threshold and (marker[2] is None or marker[2] < highlight_threshold):
+                continue
+            start = last - length + 1
+            end = last + 1
             
-            if output_format == 'html':
-                frequency_class = f"ai-freq-{item['frequency']}"
-                highlighted = f'<span class="ai-marker {frequency_class}" title="{item["text"]} ({item["category"]}, freq: {item["frequency"]})">{original_text}</span>'
-            elif output_format == 'markdown':
-                highlighted = f"**{original_text}**"
-            else:  # plain
-                highlighted = f"[AI:{original_text}]"
+            # Same word boundary rule as r'\b' on both sides of the match
+            before = start > 0 and _is_word_char(text[start - 1])
+            after = end < text_length and _is_word_char(text[end])
+            if before == _is_word_char(text[start]) or after == _is_word_char(text[last]):
+                continue
             
-            highlighted_text = highlighted_text[:item["start"]] + highlighted + highlighted_text[item["end"]:]
+            if marker[0] == "phrase":
+                phrase_spans.append((start, end))
+                yield start, end, marker
+            else:
+                # Words can only be checked once every phrase has been seen
+                word_matches.append((start, end, marker))
         
-        return highlighted_text, found_items
+        # Drop words that are part of a detected phrase
+        yield from _drop_contained_words(phrase_spans, word_matches)
+
+    def _get_fused_pattern(self, highlight_threshold):
+        """Compile (once per threshold) a single lookahead alternation over all words and phrases"""
+        if highlight_threshold not in self._fused_patterns:
+            # Phrases are added last so they win when the same text is stored as both
+            markers = {}
+            for word, frequency, category, source in self._get_terms("word", None, None, highlight_threshold):
+                markers[word.lower()] = ("word", word, frequency, category, source)
+            for phrase, frequency, category, source in self._get_terms("phrase", None, None, highlight_threshold):
+                markers[phrase.lower()] = ("phrase", phrase, frequency, category, source)
+            
+            pattern = None
+            prefixes = {}
+            # Longest first, so the lookahead reports the longest marker at each position
+            ordered = sorted(markers, key=len, reverse=True)
+            # Markers grouped by their first word, for the long-text prefilter and for
+            # large pattern sets; disabled if any marker does not start with a word character
+            index = {}
+            for marker in ordered:
+                token = _WORD_TOKEN_RE.match(marker)
+                if token is None:
+                    index = None
+                    break
+                index.setdefault(token.group(0), []).append(marker)
+            max_length = len(ordered[0]) if ordered else 0
+            if markers and (index is None or len(markers) < _INDEX_MIN_MARKERS):
+                # Keys are lowercase and the text is lowercased before scanning, so no IGNORECASE;
+                # the lookahead consumes nothing, so overlapping markers are found too
+                alternation = '|'.join(re.escape(marker) for marker in ordered)
+                pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+                # Shorter markers hidden under a longer one at the same position, longest first
+                for marker in ordered:
+                    hidden = [marker[:i] for i in range(len(marker) - 1, 0, -1) if marker[:i] in markers]
+                    if hidden:
+                        prefixes[marker] = hidden
+            self._fused_patterns[highlight_threshold] = (pattern, markers, index, max_length, prefixes)
+        return self._fused_patterns[highlight_threshold]
 
-    def analyze_text(self, text, min_frequency=1):
+    def _find_markers_regex(self, text, text_lc, highlight_threshold):
+        """Find AI markers with one fused regex scan (used without pyahocorasick)"""
+        pattern, markers, index, max_length, prefixes = self._get_fused_pattern(highlight_threshold)
+        if not markers:
+            return
+        if pattern is None:
+            # Large pattern sets skip the regex and look up each word in the index
+            matches = _find_indexed(text_lc, markers, index)
+        else:
+            if index is not None and len(text_lc) >= _PREFILTER_MIN_LENGTH:
+                spans = _candidate_spans(text_lc, index.keys(), max_length)
+            else:
+                spans = ((0, len(text_lc), len(text_lc)),)
+            matches = _find_fused(text_lc, pattern, markers, prefixes, spans)
+        
+        # Overlapping matches include words inside phrases; drop those as the automaton does
+        phrase_spans = []
+        word_matches = []
+        for match in matches:
+            if match[2][0] == "phrase":
+                phrase_spans.append(match[:2])
+                yield match
+            else:
+                word_matches.append(match)
+        yield from _drop_contained_words(phrase_spans, word_matches)
+
+    def analyze_text(self, text, min_frequency=1, return_items=True):
         """
         Analyze text for AI patterns and provide detailed statistics.
         
         Args:
             text (str): The text to analyze
             min_frequency (int): Minimum frequency to consider (1-10)
+            return_items (bool): Include the list of found markers as "found_items"
             
         Returns:
             dict: Analysis results
         """
-        # Highlight and find AI markers
-        _, found_items = self.highlight_text(text, highlight_threshold=min_frequency)
-        
-        # Count total words and sentences
-        words = re.findall(r'\b\w+\b', text)
+        # Word and sentence statistics, with the per-token work done by C-level regex and builtins
+        words = _WORD_TOKEN_RE.findall(text)
         total_words = len(words)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        total_sentences = len(sentences)
-        
-        # Word frequency analysis
-        word_freq = Counter(words)
+        total_word_length = sum(map(len, words))
+        unique_words = set(map(str.lower, words))
+        total_sentences = len(_SENTENCE_RE.findall(text))
+        
+        # AI marker statistics: count matches per distinct marker (Counter does this in C),
+        # then derive every other statistic from those few counts
+        found_items = None
+        if return_items:
+            matches = list(self._scan(text, min_frequency))
+            marker_counts = Counter(marker for _, _, marker in matches)
+            # Markers are only expanded into dicts when the caller asks for them
+            matches.sort(key=lambda x: (x[0], -x[1]))
+            found_items = [_marker_item(text, start, end, marker) for start, end, marker in matches]
+        else:
+            marker_counts = Counter(marker for _, _, marker in self._scan(text, min_frequency))
         
-        # AI marker statistics
-        word_counts = Counter()
-        phrase_counts = Counter()
+        word_counts = {}
+        phrase_counts = {}
         category_counts = Counter()
         source_counts = Counter()
+        ai_word_markers = 0
+        ai_phrase_markers = 0
+        # Weighted AI score is based on frequency of found markers
+        weighted_score = 0
         
-        for item in found_items:
-            if item["type"] == "word":
-                word_counts[item["text"]] += 1
+        for (item_type, marker_text, frequency, category, source), count in marker_counts.items():
+            if item_type == "word":
+                ai_word_markers += count
+                word_counts[marker_text] = count
             else:
-                phrase_counts[item["text"]] += 1
+                ai_phrase_markers += count
+                phrase_counts[marker_text] = count
             
-            category_counts[item["category"]] += 1
-            source_counts[item["source"]] += 1
+            weighted_score += frequency * count
+            category_counts[category] += count
+            source_counts[source] += count
         
         # AI detection score
-        ai_word_percentage = (len([i for i in found_items if i["type"] == "word"]) / total_words) * 100 if total_words > 0 else 0
-        ai_phrase_percentage = (len([i for i in found_items if i["type"] == "phrase"]) / total_sentences) * 100 if total_sentences > 0 else 0
-        
-        # Calculate weighted AI score based on frequency of found markers
-        weighted_score = 0
-        for item in found_items:
-            weighted_score += item["frequency"]
+        ai_word_percentage = (ai_word_markers / total_words) * 100 if total_words > 0 else 0
+        ai_phrase_percentage = (ai_phrase_markers / total_sentences) * 100 if total_sentences > 0 else 0
         
         weighted_ai_score = (weighted_score / (total_words + total_sentences)) * 10 if (total_words + total_sentences) > 0 else 0
         
         # Readability statistics
-        avg_word_length = sum(len(word) for word in words) / total_words if total_words > 0 else 0
+        avg_word_length = total_word_length / total_words if total_words > 0 else 0
         avg_sentence_length = total_words / total_sentences if total_sentences > 0 else 0
         
         # Prepare results
         results = {
             "total_words": total_words,
             "total_sentences": total_sentences,
-            "unique_words": len(set(word.lower() for word in words)),
+            "unique_words": len(unique_words),
             "avg_word_length": avg_word_length,
             "avg_sentence_length": avg_sentence_length,
-            "ai_markers": len(found_items),
-            "ai_word_markers": len([i for i in found_items if i["type"] == "word"]),
-            "ai_phrase_markers": len([i for i in found_items if i["type"] == "phrase"]),
+            "ai_markers": ai_word_markers + ai_phrase_markers,
+            "ai_word_markers": ai_word_markers,
+            "ai_phrase_markers": ai_phrase_markers,
             "ai_word_percentage": ai_word_percentage,
             "ai_phrase_percentage": ai_phrase_percentage,
             "weighted_ai_score": weighted_ai_score,
-            "word_counts": dict(word_counts),
-            "phrase_counts": dict(phrase_counts),
+            "word_counts": word_counts,
+            "phrase_counts": phrase_counts,
             "category_counts": dict(category_counts),
-            "source_counts": dict(source_counts),
-            "found_items": found_items
+            "source_counts": dict(source_counts)
         }
+        if found_items is not None:
+            results["found_items"] = found_items
         
         # Save analysis to history
         self.save_analysis(text, results)
@@ -439,10 +933,8 @@ class AIContentAnalyzer:
     
     def save_analysis(self, text, results):
         """Save analysis results to the database"""
-        import hashlib
-        
-        # Create a hash of the text to use as an identifier
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        # Create a hash of the text to use as an identifier (OpenSSL uses SHA-NI where available)
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
         
         # Convert results to JSON
         results_json = json.dumps({
@@ -452,24 +944,29 @@ class AIContentAnalyzer:
         # Current timestamp
         timestamp = datetime.now().isoformat()
         
-        try:
-            self.cursor.execute(
-                'INSERT INTO analysis_history (text_hash, timestamp, total_words, ai_markers, ai_percentage, results) VALUES (?, ?, ?, ?, ?, ?)',
-                (
-                    text_hash,
-                    timestamp,
-                    results["total_words"],
-                    results["ai_markers"],
-                    results["ai_word_percentage"],
-                    results_json
-                )
-            )
-            self.conn.commit()
-        except Exception as e:
-            print(f"Error saving analysis: {e}")
+        # Buffered in memory rather than inserted, so no transaction stays open between
+        # analyses; written in batches by flush() instead of once per analysis
+        if not self._history_rows:
+            self._history_since = time.monotonic()
+        self._history_rows.append((
+            text_hash,
+            timestamp,
+            results["total_words"],
+            results["ai_markers"],
+            results["ai_word_percentage"],
+            results_json
+        ))
+        if (len(self._history_rows) >= _HISTORY_BATCH_ROWS
+                or time.monotonic() - self._history_since >= _HISTORY_BATCH_SECONDS):
+            self.flush()
+
+    def flush(self):
+        """Write the analysis history rows saved since the last flush in one transaction"""
+        _write_history(self.conn, self._history_rows)
 
     def get_analysis_history(self, limit=10):
         """Get recent analysis history"""
+        self.flush()
         self.cursor.execute(
             'SELECT timestamp, total_words, ai_markers, ai_percentage, results FROM analysis_history ORDER BY timestamp DESC LIMIT ?',
             (limit,)
@@ -486,6 +983,10 @@ class AIContentAnalyzer:
         Returns:
             dict: Suggestions and improvements
         """
+        # Reports built from the same analysis share one set of suggestions
+        if "_suggestions" in analysis_results:
+            return analysis_results["_suggestions"]
+        
         suggestions = {
             "general": [],
             "word_replacements": {},
@@ -505,14 +1006,14 @@ class AIContentAnalyzer:
             suggestions["general"].append("Text has a low AI signature. Only minor adjustments needed.")
         
         # Word replacement suggestions
-        for word, count in analysis_results["word_counts"].items():
-            if word in self.get_word_replacements():
-                suggestions["word_replacements"][word] = self.get_word_replacements()[word]
+        for word in analysis_results["word_counts"]:
+            if word in _WORD_REPLACEMENTS:
+                suggestions["word_replacements"][word] = _WORD_REPLACEMENTS[word]
         
         # Phrase replacement suggestions
-        for phrase, count in analysis_results["phrase_counts"].items():
-            if phrase in self.get_phrase_replacements():
-                suggestions["phrase_replacements"][phrase] = self.get_phrase_replacements()[phrase]
+        for phrase in analysis_results["phrase_counts"]:
+            if phrase in _PHRASE_REPLACEMENTS:
+                suggestions["phrase_replacements"][phrase] = _PHRASE_REPLACEMENTS[phrase]
         
         # Structure suggestions
         avg_sentence_length = analysis_results["avg_sentence_length"]
@@ -523,46 +1024,31 @@ class AIContentAnalyzer:
         if analysis_results["ai_word_percentage"] > 20:
             suggestions["seo"].append("High AI word percentage might impact SEO. Revise the most commonly flagged words.")
         
+        analysis_results["_suggestions"] = suggestions
         return suggestions
     
+    def get_top_counts(self, analysis_results):
+        """
+        Get the most frequent AI words and phrases, computed once per analysis.
+        
+        Args:
+            analysis_results (dict): The analysis results from analyze_text()
+            
+        Returns:
+            tuple: (top words, top phrases) as lists of (text, count), most frequent first
+        """
+        if "_top_words" not in analysis_results:
+            analysis_results["_top_words"] = _top_counts(analysis_results["word_counts"])
+            analysis_results["_top_phrases"] = _top_counts(analysis_results["phrase_counts"])
+        return analysis_results["_top_words"], analysis_results["_top_phrases"]
+    
     def get_word_replacements(self):
         """Dictionary of common AI words and suggested replacements"""
-        return {
-            "delve": ["explore", "examine", "investigate", "look into"],
-            "whilst": ["while", "as", "during", "when"],
-            "furthermore": ["also", "besides", "plus", "in addition"],
-            "utilize": ["use", "apply", "employ"],
-            "leverage": ["use", "apply", "employ", "harness"],
-            "robust": ["strong", "solid", "durable", "powerful"],
-            "optimal": ["best", "ideal", "perfect", "prime"],
-            "essentially": ["basically", "mainly", "primarily", "at heart"],
-            "ultimately": ["finally", "in the end", "eventually", "in conclusion"],
-            "myriad": ["many", "numerous", "countless", "various"],
-            "seamless": ["smooth", "flawless", "perfect", "uninterrupted"],
-            "plethora": ["abundance", "wealth", "excess", "plenty"],
-            "harness": ["use", "utilize", "channel", "direct"],
-            "elevate": ["raise", "lift", "boost", "improve"],
-            "tapestry": ["mixture", "blend", "fabric", "collection"],
-            "captivate": ["engage", "entrance", "fascinate", "charm"],
-            "testament": ["proof", "evidence", "example", "demonstration"]
-        }
+        return _WORD_REPLACEMENTS
     
     def get_phrase_replacements(self):
         """Dictionary of common AI phrases and suggested replacements"""
-        return {
-            "in this article": ["here", "in these pages", "below", "in what follows"],
-            "delve into": ["explore", "examine", "look at", "investigate"],
-            "it's important to note": ["note that", "remember", "keep in mind", "be aware"],
-            "on the other hand": ["however", "conversely", "in contrast", "alternatively"],
-            "in the realm of": ["in", "within", "concerning", "regarding"],
-            "a wide range of": ["many", "various", "diverse", "different"],
-            "it is worth mentioning": ["notably", "interestingly", "remarkably"],
-            "plays a crucial role": ["is important for", "is vital to", "is key to"],
-            "in conclusion": ["to wrap up", "finally", "to sum up", "in closing"],
-            "in summary": ["in short", "to recap", "in brief", "to summarize briefly"],
-            "when it comes to": ["regarding", "about", "concerning", "on the topic of"],
-            "as mentioned earlier": ["as I said", "as noted", "as stated above"]
-        }
+        return _PHRASE_REPLACEMENTS
     
     def export_analysis_to_html(self, text, analysis_results, filename=None):
         """
@@ -570,7 +1056,7 @@ class AIContentAnalyzer:
         
         Args:
             text (str): The original text
-            analysis_results (dict): Analysis results
+            analysis_results (dict): Analysis results, with or without "found_items"
             filename (str): Output filename (default: analysis_YYYY-MM-DD.html)
             
         Returns:
@@ -580,11 +1066,16 @@ class AIContentAnalyzer:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             filename = f"analysis_{timestamp}.html"
         
-        # Generate highlighted text
-        highlighted_text, _ = self.highlight_text(text, output_format='html')
+        # Generate highlighted text; its markers stand in for found_items when the
+        # results came from analyze_text(return_items=False)
+        highlighted_text, found_items = self.highlight_text(text, output_format='html')
+        found_items = analysis_results.get("found_items", found_items)
         
-        # Create HTML
-        html = f"""
+        # Stream the report straight to the file; the large buffer batches the writes
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            
+            write(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -674,21 +1165,24 @@ class AIContentAnalyzer:
                         <th>Frequency Score</th>
                         <th>Category</th>
                     </tr>
-        """
-        
-        # Add word rows
-        for item in sorted(analysis_results["found_items"], key=lambda x: x["frequency"], reverse=True):
-            if item["type"] == "word":
-                html += f"""
-                    <tr>
-                        <td>{item["text"]}</td>
-                        <td>{analysis_results["word_counts"][item["text"]]}</td>
-                        <td>{item["frequency"]}</td>
-                        <td>{item["category"]}</td>
-                    </tr>
-                """
-        
-        html += """
+        """)
+            
+            # Sort the markers once and split them between the two tables
+            sorted_items = sorted(found_items, key=lambda x: x["frequency"], reverse=True)
+            word_items = [item for item in sorted_items if item["type"] == "word"]
+            phrase_items = [item for item in sorted_items if item["type"] == "phrase"]
+            word_counts = analysis_results["word_counts"]
+            phrase_counts = analysis_results["phrase_counts"]
+            
+            # Add word rows, formatted from one template and written in a single call;
+            # words, phrases and categories can come from user input, so they are escaped
+            write("".join([
+                _TABLE_ROW.format(escape(item["text"]), word_counts[item["text"]],
+                                  escape(str(item["frequency"])), escape(str(item["category"])))
+                for item in word_items
+            ]))
+            
+            write("""
                 </table>
                 
                 <h2>AI Phrases Detected</h2>
@@ -699,54 +1193,53 @@ class AIContentAnalyzer:
                         <th>Frequency Score</th>
                         <th>Category</th>
                     </tr>
-        """
-        
-        # Add phrase rows
-        for item in sorted(analysis_results["found_items"], key=lambda x: x["frequency"], reverse=True):
-            if item["type"] == "phrase":
-                html += f"""
-                    <tr>
-                        <td>{item["text"]}</td>
-                        <td>{analysis_results["phrase_counts"].get(item["text"], 0)}</td>
-                        <td>{item["frequency"]}</td>
-                        <td>{item["category"]}</td>
-                    </tr>
-                """
-        
-        # Generate suggestions
-        suggestions = self.generate_suggestions(analysis_results)
-        
-        html += """
+        """)
+            
+            # Add phrase rows
+            write("".join([
+                _TABLE_ROW.format(escape(item["text"]), phrase_counts.get(item["text"], 0),
+                                  escape(str(item["frequency"])), escape(str(item["category"])))
+                for item in phrase_items
+            ]))
+            
+            # Generate suggestions
+            suggestions = self.generate_suggestions(analysis_results)
+            
+            write("""
                 </table>
                 
                 <h2>Suggestions</h2>
                 <div class="suggestions">
-        """
-        
-        # Add general suggestions
-        if suggestions["general"]:
-            html += "<h3>General</h3><ul>"
-            for suggestion in suggestions["general"]:
-                html += f"<li>{suggestion}</li>"
-            html += "</ul>"
-        
-        # Add SEO suggestions
-        if suggestions["seo"]:
-            html += "<h3>SEO</h3><ul>"
-            for suggestion in suggestions["seo"]:
-                html += f"<li>{suggestion}</li>"
-            html += "</ul>"
-        
-        html += """
+        """)
+            
+            # Each list is written in one call, escaped like the tables above
+            if suggestions["general"]:
+                write("<h3>General</h3><ul>" + "".join(f"<li>{escape(suggestion)}</li>" for suggestion in suggestions["general"]) + "</ul>")
+            
+            if suggestions["word_replacements"]:
+                write("<h3>Word Replacements</h3><ul>" + "".join(
+                    f"<li><strong>{escape(word)}</strong> → {escape(_WORD_REPLACEMENT_TEXT[word])}</li>"
+                    for word in suggestions["word_replacements"]
+                ) + "</ul>")
+            
+            if suggestions["phrase_replacements"]:
+                write("<h3>Phrase Replacements</h3><ul>" + "".join(
+                    f"<li><strong>{escape(phrase)}</strong> → {escape(_PHRASE_REPLACEMENT_TEXT[phrase])}</li>"
+                    for phrase in suggestions["phrase_replacements"]
+                ) + "</ul>")
+            
+            if suggestions["structure"]:
+                write("<h3>Structure</h3><ul>" + "".join(f"<li>{escape(suggestion)}</li>" for suggestion in suggestions["structure"]) + "</ul>")
+            
+            if suggestions["seo"]:
+                write("<h3>SEO</h3><ul>" + "".join(f"<li>{escape(suggestion)}</li>" for suggestion in suggestions["seo"]) + "</ul>")
+            
+            write("""
                 </div>
             </div>
         </body>
         </html>
-        """
-        
-        # Write HTML to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html)
+        """)
         
         return filename
 
@@ -765,56 +1258,43 @@ class AIContentAnalyzer:
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             filename = f"analysis_{timestamp}.csv"
         
-        # Prepare data for CSV
-        data = {
-            "Metric": [
-                "Total Words",
-                "Total Sentences",
-                "Unique Words",
-                "Average Word Length",
-                "Average Sentence Length",
-                "AI Markers",
-                "AI Word Markers",
-                "AI Phrase Markers",
-                "AI Word Percentage",
-                "AI Phrase Percentage",
-                "Weighted AI Score"
-            ],
-            "Value": [
-                analysis_results["total_words"],
-                analysis_results["total_sentences"],
-                analysis_results["unique_words"],
-                analysis_results["avg_word_length"],
-                analysis_results["avg_sentence_length"],
-                analysis_results["ai_markers"],
-                analysis_results["ai_word_markers"],
-                analysis_results["ai_phrase_markers"],
-                analysis_results["ai_word_percentage"],
-                analysis_results["ai_phrase_percentage"],
-                analysis_results["weighted_ai_score"]
-            ]
-        }
+        # Metric names and the results they come from
+        metrics = [
+            ("Total Words", "total_words"),
+            ("Total Sentences", "total_sentences"),
+            ("Unique Words", "unique_words"),
+            ("Average Word Length", "avg_word_length"),
+            ("Average Sentence Length", "avg_sentence_length"),
+            ("AI Markers", "ai_markers"),
+            ("AI Word Markers", "ai_word_markers"),
+            ("AI Phrase Markers", "ai_phrase_markers"),
+            ("AI Word Percentage", "ai_word_percentage"),
+            ("AI Phrase Percentage", "ai_phrase_percentage"),
+            ("Weighted AI Score", "weighted_ai_score")
+        ]
         
-        # Create DataFrame and export to CSV
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        # Values are written as floats, as the single mixed column always has been
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["Metric", "Value"])
+            writer.writerows((name, float(analysis_results[key])) for name, key in metrics)
         
         # Additional CSVs for detailed data
-        word_counts_df = pd.DataFrame([
-            {"Word": word, "Count": count}
-            for word, count in analysis_results["word_counts"].items()
-        ])
-        if not word_counts_df.empty:
+        word_counts = analysis_results["word_counts"]
+        if word_counts:
             word_counts_filename = filename.replace('.csv', '_word_counts.csv')
-            word_counts_df.to_csv(word_counts_filename, index=False)
+            with open(word_counts_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(["Word", "Count"])
+                writer.writerows(word_counts.items())
         
-        phrase_counts_df = pd.DataFrame([
-            {"Phrase": phrase, "Count": count}
-            for phrase, count in analysis_results["phrase_counts"].items()
-        ])
-        if not phrase_counts_df.empty:
+        phrase_counts = analysis_results["phrase_counts"]
+        if phrase_counts:
             phrase_counts_filename = filename.replace('.csv', '_phrase_counts.csv')
-            phrase_counts_df.to_csv(phrase_counts_filename, index=False)
+            with open(phrase_counts_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(["Phrase", "Count"])
+                writer.writerows(phrase_counts.items())
         
         return filename
 
@@ -838,111 +1318,151 @@ class AIContentAnalyzer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         visualization_files = []
         
-        # Set style for all plots
-        plt.style.use('seaborn-v0_8-whitegrid')
+        # Plotting libraries are slow to import, so only load them when charts are drawn
+        import numpy as np
+        plt = _get_pyplot()
         
-        # 1. AI Score Gauge Chart
-        fig, ax = plt.subplots(figsize=(8, 8))
+        # One figure is cleared and resized for each chart instead of creating new ones
+        if self._fig is None:
+            self._fig = plt.figure()
+        fig = self._fig
         
-        # Create a gauge chart using a half donut
-        ai_score = analysis_results["weighted_ai_score"]
+        # 1. AI Score Gauge Chart
+        # The gauge only depends on the score shown (one decimal), so each one is
+        # rendered once and copied from the cache afterwards
+        ai_score = round(analysis_results["weighted_ai_score"], 1)
         max_score = 10
+        gauge_chart_path = os.path.join(output_dir, f"ai_score_gauge_{timestamp}.png")
+        cached_gauge = os.path.join(self._gauge_cache_dir, f"gauge_{ai_score:.1f}.png")
         
-        # Colors based on score
-        if ai_score < 3:
-            color = 'green'
-        elif ai_score < 7:
-            color = 'orange'
+        if os.path.exists(cached_gauge):
+            shutil.copyfile(cached_gauge, gauge_chart_path)
         else:
-            color = 'red'
-        
-        # Plot the gauge
-        ax.pie(
-            [ai_score, max_score - ai_score],
-            colors=[color, '#f0f0f0'],
-            startangle=90,
-            counterclock=False,
-            wedgeprops={'width': 0.4}
-        )
-        
-        # Add a circle at the center to make it look like a gauge
-        centre_circle = plt.Circle((0, 0), 0.25, fc='white')
-        ax.add_patch(centre_circle)
-        
-        # Add text
-        ax.text(0, 0, f"{ai_score:.1f}", ha='center', va='center', fontsize=36)
-        ax.text(0, -0.15, "AI Score", ha='center', va='center', fontsize=16)
-        
-        # Add score labels
-        ax.text(-0.8, -0.1, "Low", fontsize=12)
-        ax.text(0, 0.8, "Medium", fontsize=12)
-        ax.text(0.8, -0.1, "High", fontsize=12)
-        
-        ax.set_title("AI Content Detection Score", fontsize=18, pad=20)
-        ax.axis('equal')
-        
-        gauge_chart_path = os.path.join(output_dir, f"ai_score_gauge_{timestamp}.png")
-        plt.savefig(gauge_chart_path, bbox_inches='tight')
-        plt.close()
+            fig.clear()
+            fig.set_size_inches(8, 8)
+            ax = fig.add_subplot()
+            
+            # Colors based on score
+            if ai_score < 3:
+                color = 'green'
+            elif ai_score < 7:
+                color = 'orange'
+            else:
+                color = 'red'
+            
+            # Plot the gauge
+            ax.pie(
+                [ai_score, max_score - ai_score],
+                colors=[color, '#f0f0f0'],
+                startangle=90,
+                counterclock=False,
+                wedgeprops={'width': 0.4}
+            )
+            
+            # Add a circle at the center to make it look like a gauge
+            centre_circle = plt.Circle((0, 0), 0.25, fc='white')
+            ax.add_patch(centre_circle)
+            
+            # Add text
+            ax.text(0, 0, f"{ai_score:.1f}", ha='center', va='center', fontsize=36)
+            ax.text(0, -0.15, "AI Score", ha='center', va='center', fontsize=16)
+            
+            # Add score labels
+            ax.text(-0.8, -0.1, "Low", fontsize=12)
+            ax.text(0, 0.8, "Medium", fontsize=12)
+            ax.text(0.8, -0.1, "High", fontsize=12)
+            
+            ax.set_title("AI Content Detection Score", fontsize=18, pad=20)
+            ax.axis('equal')
+            
+            fig.savefig(gauge_chart_path, dpi=100)
+            try:
+                os.makedirs(self._gauge_cache_dir, exist_ok=True)
+                # Copy under a temporary name first so other processes never see a partial file
+                partial = f"{cached_gauge}.{os.getpid()}.tmp"
+                shutil.copyfile(gauge_chart_path, partial)
+                os.replace(partial, cached_gauge)
+            except OSError as e:
+                print(f"Error caching gauge chart: {e}")
         visualization_files.append(gauge_chart_path)
         
         # 2. Word and Phrase Counts Bar Chart
         if analysis_results["word_counts"] or analysis_results["phrase_counts"]:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 12))
+            fig.clear()
+            fig.set_size_inches(10, 12)
+            ax1, ax2 = fig.subplots(2, 1)
+            top_word_counts, top_phrase_counts = self.get_top_counts(analysis_results)
             
-            # Word counts
+            # Word counts, most frequent at the top
             if analysis_results["word_counts"]:
-                top_words = dict(sorted(analysis_results["word_counts"].items(), key=lambda x: x[1], reverse=True)[:10])
+                top_words = dict(top_word_counts)
                 
-                sns.barplot(x=list(top_words.values()), y=list(top_words.keys()), palette="Blues_d", ax=ax1)
+                ax1.barh(list(top_words.keys()), list(top_words.values()),
+                         color=plt.cm.Blues(np.linspace(0.9, 0.4, len(top_words))))
+                ax1.invert_yaxis()
                 ax1.set_title("Top AI Words Detected", fontsize=14)
                 ax1.set_xlabel("Count", fontsize=12)
                 ax1.set_ylabel("Word", fontsize=12)
             
             # Phrase counts
             if analysis_results["phrase_counts"]:
-                top_phrases = dict(sorted(analysis_results["phrase_counts"].items(), key=lambda x: x[1], reverse=True)[:10])
+                top_phrases = dict(top_phrase_counts)
                 
-                sns.barplot(x=list(top_phrases.values()), y=list(top_phrases.keys()), palette="Greens_d", ax=ax2)
+                ax2.barh(list(top_phrases.keys()), list(top_phrases.values()),
+                         color=plt.cm.Greens(np.linspace(0.9, 0.4, len(top_phrases))))
+                ax2.invert_yaxis()
                 ax2.set_title("Top AI Phrases Detected", fontsize=14)
                 ax2.set_xlabel("Count", fontsize=12)
                 ax2.set_ylabel("Phrase", fontsize=12)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             counts_chart_path = os.path.join(output_dir, f"ai_word_phrase_counts_{timestamp}.png")
-            plt.savefig(counts_chart_path, bbox_inches='tight')
-            plt.close()
+            fig.savefig(counts_chart_path, dpi=100)
             visualization_files.append(counts_chart_path)
         
         # 3. Category Distribution Pie Chart
         if analysis_results["category_counts"]:
-            fig, ax = plt.subplots(figsize=(8, 8))
+            fig.clear()
+            fig.set_size_inches(8, 8)
+            ax = fig.add_subplot()
             
             categories = list(analysis_results["category_counts"].keys())
             counts = list(analysis_results["category_counts"].values())
             
+            colors = self._category_color_cache.get(len(categories))
+            if colors is None:
+                colors = plt.cm.Paired(np.linspace(0, 1, len(categories)))
+                self._category_color_cache[len(categories)] = colors
+            
             ax.pie(
                 counts,
                 labels=categories,
                 autopct='%1.1f%%',
                 startangle=90,
-                colors=plt.cm.Paired(np.linspace(0, 1, len(categories)))
+                colors=colors
             )
             ax.axis('equal')
             
             ax.set_title("AI Marker Categories", fontsize=16)
+            # Labels sit outside the axes, so fit them once here rather than with a tight bbox on save
+            fig.tight_layout()
             
             categories_chart_path = os.path.join(output_dir, f"ai_categories_{timestamp}.png")
-            plt.savefig(categories_chart_path, bbox_inches='tight')
-            plt.close()
+            fig.savefig(categories_chart_path, dpi=100)
             visualization_files.append(categories_chart_path)
         
         return visualization_files
 
     def close(self):
         """Close the database connection"""
+        if self._fig is not None:
+            _pyplot.close(self._fig)
+            self._fig = None
         if self.conn:
+            self.flush()
+            # Let SQLite refresh statistics for tables whose query patterns changed
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
             self.conn = None
             self.cursor = None
@@ -966,8 +1486,8 @@ def main():
     parser.add_argument('--db', help='Path to custom database file')
     
     # Database management options
-    parser.add_argument('--add-word', help='Add a new AI word to the database')
-    parser.add_argument('--add-phrase', help='Add a new AI phrase to the database')
+    parser.add_argument('--add-word', action='append', help='Add a new AI word to the database (repeatable)')
+    parser.add_argument('--add-phrase', action='append', help='Add a new AI phrase to the database (repeatable)')
     parser.add_argument('--frequency', type=int, default=5, help='Frequency for new word/phrase (1-10)')
     parser.add_argument('--category', default='general', help='Category for new word/phrase')
     parser.add_argument('--source', default='user', help='Source for new word/phrase')
@@ -979,19 +1499,25 @@ def main():
     
     # Handle database management commands
     if args.add_word:
-        success = analyzer.add_word(args.add_word, args.frequency, args.category, args.source)
-        if success:
-            print(f"Word '{args.add_word}' added to database")
-        else:
-            print(f"Failed to add word '{args.add_word}'")
+        success = analyzer.add_words_batch(
+            (word, args.frequency, args.category, args.source) for word in args.add_word
+        )
+        for word in args.add_word:
+            if success:
+                print(f"Word '{word}' added to database")
+            else:
+                print(f"Failed to add word '{word}'")
         return
     
     if args.add_phrase:
-        success = analyzer.add_phrase(args.add_phrase, args.frequency, args.category, args.source)
-        if success:
-            print(f"Phrase '{args.add_phrase}' added to database")
-        else:
-            print(f"Failed to add phrase '{args.add_phrase}'")
+        success = analyzer.add_phrases_batch(
+            (phrase, args.frequency, args.category, args.source) for phrase in args.add_phrase
+        )
+        for phrase in args.add_phrase:
+            if success:
+                print(f"Phrase '{phrase}' added to database")
+            else:
+                print(f"Failed to add phrase '{phrase}'")
         return
     
     # Get text to analyze
@@ -1010,7 +1536,9 @@ def main():
         return
     
     # Analyze the text
-    results = analyzer.analyze_text(text, min_frequency=args.min_freq)
+    # The marker list is only needed for the HTML report
+    results = analyzer.analyze_text(text, min_frequency=args.min_freq,
+                                    return_items=args.format in ('html', 'all'))
     
     # Generate output based on format
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1033,14 +1561,18 @@ def main():
         print(f"AI Phrase Percentage: {results['ai_phrase_percentage']:.2f}%")
         print(f"Weighted AI Score: {results['weighted_ai_score']:.2f}/10")
         
+        # Sorted once: the console shows the top 10, the report file lists everything
+        sorted_words = sorted(results['word_counts'].items(), key=itemgetter(1), reverse=True)
+        sorted_phrases = sorted(results['phrase_counts'].items(), key=itemgetter(1), reverse=True)
+        
         if results['word_counts']:
             print("\nTop AI Words Detected:")
-            for word, count in sorted(results['word_counts'].items(), key=lambda x: x[1], reverse=True)[:10]:
+            for word, count in islice(sorted_words, 10):
                 print(f"  - {word}: {count}")
         
         if results['phrase_counts']:
             print("\nTop AI Phrases Detected:")
-            for phrase, count in sorted(results['phrase_counts'].items(), key=lambda x: x[1], reverse=True)[:10]:
+            for phrase, count in islice(sorted_phrases, 10):
                 print(f"  - {phrase}: {count}")
         
         # Generate and print suggestions
@@ -1055,56 +1587,60 @@ def main():
         
         if suggestions['word_replacements']:
             print("\nWord Replacements:")
-            for word, replacements in suggestions['word_replacements'].items():
-                print(f"  - {word} → {', '.join(replacements)}")
+            for word in suggestions['word_replacements']:
+                print(f"  - {word} → {_WORD_REPLACEMENT_TEXT[word]}")
         
         if suggestions['phrase_replacements']:
             print("\nPhrase Replacements:")
-            for phrase, replacements in suggestions['phrase_replacements'].items():
-                print(f"  - {phrase} → {', '.join(replacements)}")
+            for phrase in suggestions['phrase_replacements']:
+                print(f"  - {phrase} → {_PHRASE_REPLACEMENT_TEXT[phrase]}")
         
         # Also save to a text file
         output_file = os.path.join(args.output, f"analysis_{timestamp}.txt")
+        # Collect the report lines and write them in one go
+        lines = [
+            "AI CONTENT ANALYSIS\n",
+            "="*50 + "\n\n",
+            f"Total Words: {results['total_words']}\n",
+            f"Total Sentences: {results['total_sentences']}\n",
+            f"Unique Words: {results['unique_words']}\n",
+            f"AI Markers Found: {results['ai_markers']}\n",
+            f"AI Word Percentage: {results['ai_word_percentage']:.2f}%\n",
+            f"AI Phrase Percentage: {results['ai_phrase_percentage']:.2f}%\n",
+            f"Weighted AI Score: {results['weighted_ai_score']:.2f}/10\n\n"
+        ]
+        
+        if results['word_counts']:
+            lines.append("Top AI Words Detected:\n")
+            for word, count in sorted_words:
+                lines.append(f"  - {word}: {count}\n")
+            lines.append("\n")
+        
+        if results['phrase_counts']:
+            lines.append("Top AI Phrases Detected:\n")
+            for phrase, count in sorted_phrases:
+                lines.append(f"  - {phrase}: {count}\n")
+            lines.append("\n")
+        
+        lines.append("Suggestions:\n")
+        
+        if suggestions['general']:
+            lines.append("\nGeneral:\n")
+            for suggestion in suggestions['general']:
+                lines.append(f"  - {suggestion}\n")
+        
+        if suggestions['word_replacements']:
+            lines.append("\nWord Replacements:\n")
+            for word in suggestions['word_replacements']:
+                lines.append(f"  - {word} → {_WORD_REPLACEMENT_TEXT[word]}\n")
+        
+        if suggestions['phrase_replacements']:
+            lines.append("\nPhrase Replacements:\n")
+            for phrase in suggestions['phrase_replacements']:
+                lines.append(f"  - {phrase} → {_PHRASE_REPLACEMENT_TEXT[phrase]}\n")
+        
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("AI CONTENT ANALYSIS\n")
-            f.write("="*50 + "\n\n")
-            
-            f.write(f"Total Words: {results['total_words']}\n")
-            f.write(f"Total Sentences: {results['total_sentences']}\n")
-            f.write(f"Unique Words: {results['unique_words']}\n")
-            f.write(f"AI Markers Found: {results['ai_markers']}\n")
-            f.write(f"AI Word Percentage: {results['ai_word_percentage']:.2f}%\n")
-            f.write(f"AI Phrase Percentage: {results['ai_phrase_percentage']:.2f}%\n")
-            f.write(f"Weighted AI Score: {results['weighted_ai_score']:.2f}/10\n\n")
-            
-            if results['word_counts']:
-                f.write("Top AI Words Detected:\n")
-                for word, count in sorted(results['word_counts'].items(), key=lambda x: x[1], reverse=True):
-                    f.write(f"  - {word}: {count}\n")
-                f.write("\n")
-            
-            if results['phrase_counts']:
-                f.write("Top AI Phrases Detected:\n")
-                for phrase, count in sorted(results['phrase_counts'].items(), key=lambda x: x[1], reverse=True):
-                    f.write(f"  - {phrase}: {count}\n")
-                f.write("\n")
-            
-            f.write("Suggestions:\n")
-            
-            if suggestions['general']:
-                f.write("\nGeneral:\n")
-                for suggestion in suggestions['general']:
-                    f.write(f"  - {suggestion}\n")
-            
-            if suggestions['word_replacements']:
-                f.write("\nWord Replacements:\n")
-                for word, replacements in suggestions['word_replacements'].items():
-                    f.write(f"  - {word} → {', '.join(replacements)}\n")
-            
-            if suggestions['phrase_replacements']:
-                f.write("\nPhrase Replacements:\n")
-                for phrase, replacements in suggestions['phrase_replacements'].items():
-                    f.write(f"  - {phrase} → {', '.join(replacements)}\n")
+            f.write("".join(lines))
     
     if args.format == 'csv' or args.format == 'all':
         csv_file = os.path.join(args.output, f"analysis_{timestamp}.csv")
@@ -1129,25 +1665,3 @@ def main():
 
 if __name__ == "__main__":
     main()
->"
-            html += "</ul>"
-        
-        # Add word replacements
-        if suggestions["word_replacements"]:
-            html += "<h3>Word Replacements</h3><ul>"
-            for word, replacements in suggestions["word_replacements"].items():
-                html += f"<li><strong>{word}</strong> → {', '.join(replacements)}</li>"
-            html += "</ul>"
-        
-        # Add phrase replacements
-        if suggestions["phrase_replacements"]:
-            html += "<h3>Phrase Replacements</h3><ul>"
-            for phrase, replacements in suggestions["phrase_replacements"].items():
-                html += f"<li><strong>{phrase}</strong> → {', '.join(replacements)}</li>"
-            html += "</ul>"
-        
-        # Add structure suggestions
-        if suggestions["structure"]:
-            html += "<h3>Structure</h3><ul>"
-            for suggestion in suggestions["structure"]:
-                html += f"<li>{suggestion}</li
\ No newline at end of file